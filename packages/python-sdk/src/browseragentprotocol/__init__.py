@@ -54,155 +54,288 @@ CLI usage:
     ```
 """
 
-__version__ = "0.9.0"
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# Main client classes
-from browseragentprotocol.client import BAPClient
-from browseragentprotocol.sync_client import BAPClientSync
+from browseragentprotocol._version import __version__
 
-# Transport layers
-from browseragentprotocol.transport import WebSocketTransport
-from browseragentprotocol.sse import SSETransport
+if TYPE_CHECKING:
+    # Main client classes
+    from browseragentprotocol.client import BAPClient
+    from browseragentprotocol.sync_client import BAPClientSync
 
-# Context managers
-from browseragentprotocol.context import bap_client, bap_session
+    # Transport layers
+    from browseragentprotocol.transport import WebSocketTransport
+    from browseragentprotocol.sse import SSETransport
 
-# Errors
-from browseragentprotocol.errors import (
-    BAPError,
-    BAPConnectionError,
-    BAPParseError,
-    BAPInvalidRequestError,
-    BAPMethodNotFoundError,
-    BAPInvalidParamsError,
-    BAPNotInitializedError,
-    BAPAlreadyInitializedError,
-    BAPBrowserNotLaunchedError,
-    BAPPageNotFoundError,
-    BAPElementNotFoundError,
-    BAPElementNotVisibleError,
-    BAPElementNotEnabledError,
-    BAPSelectorAmbiguousError,
-    BAPNavigationError,
-    BAPTimeoutError,
-    BAPActionError,
-    BAPTargetClosedError,
-    BAPExecutionContextDestroyedError,
-    BAPContextNotFoundError,
-    BAPResourceLimitExceededError,
-    BAPApprovalDeniedError,
-    BAPApprovalTimeoutError,
-    BAPApprovalRequiredError,
-    BAPFrameNotFoundError,
-    BAPDomainNotAllowedError,
-    BAPStreamNotFoundError,
-    BAPStreamCancelledError,
-)
+    # Context managers
+    from browseragentprotocol.context import bap_client, bap_session
 
-# Selector factory functions
-from browseragentprotocol.types.selectors import (
-    css,
-    xpath,
-    role,
-    text,
-    label,
-    placeholder,
-    test_id,
-    semantic,
-    coords,
-    ref,
-    # Selector types
-    AriaRole,
-    BAPSelector,
-    CSSSelector,
-    XPathSelector,
-    RoleSelector,
-    TextSelector,
-    LabelSelector,
-    PlaceholderSelector,
-    TestIdSelector,
-    SemanticSelector,
-    CoordinatesSelector,
-    RefSelector,
-)
+    # Errors
+    from browseragentprotocol.errors import (
+        BAPError,
+        BAPConnectionError,
+        BAPParseError,
+        BAPInvalidRequestError,
+        BAPMethodNotFoundError,
+        BAPInvalidParamsError,
+        BAPNotInitializedError,
+        BAPAlreadyInitializedError,
+        BAPBrowserNotLaunchedError,
+        BAPPageNotFoundError,
+        BAPElementNotFoundError,
+        BAPElementNotVisibleError,
+        BAPElementNotEnabledError,
+        BAPSelectorAmbiguousError,
+        BAPNavigationError,
+        BAPTimeoutError,
+        BAPActionError,
+        BAPTargetClosedError,
+        BAPExecutionContextDestroyedError,
+        BAPContextNotFoundError,
+        BAPResourceLimitExceededError,
+        BAPApprovalDeniedError,
+        BAPApprovalTimeoutError,
+        BAPApprovalRequiredError,
+        BAPFrameNotFoundError,
+        BAPDomainNotAllowedError,
+        BAPStreamNotFoundError,
+        BAPStreamCancelledError,
+    )
 
-# Protocol types
-from browseragentprotocol.types.protocol import (
-    BAP_VERSION,
-    ErrorCodes,
-)
+    # Selector factory functions
+    from browseragentprotocol.types.selectors import (
+        css,
+        xpath,
+        role,
+        text,
+        label,
+        placeholder,
+        test_id,
+        semantic,
+        coords,
+        ref,
+        # Selector types
+        AriaRole,
+        BAPSelector,
+        CSSSelector,
+        XPathSelector,
+        RoleSelector,
+        TextSelector,
+        LabelSelector,
+        PlaceholderSelector,
+        TestIdSelector,
+        SemanticSelector,
+        CoordinatesSelector,
+        RefSelector,
+    )
 
-# Common types
-from browseragentprotocol.types.common import (
-    AccessibilityNode,
-    ActionOptions,
-    BoundingBox,
-    ClickOptions,
-    ContentFormat,
-    Cookie,
-    Page,
-    PageStatus,
-    ScreenshotFormat,
-    ScreenshotOptions,
-    ScrollDirection,
-    ScrollOptions,
-    StorageState,
-    TypeOptions,
-    Viewport,
-    WaitUntilState,
-)
+    # Protocol types
+    from browseragentprotocol.types.protocol import (
+        BAP_VERSION,
+        ErrorCodes,
+    )
 
-# Agent types
-from browseragentprotocol.types.agent import (
-    ActionHint,
-    AgentActParams,
-    AgentActResult,
-    AgentExtractParams,
-    AgentExtractResult,
-    AgentObserveParams,
-    AgentObserveResult,
-    AnnotationOptions,
-    ExecutionStep,
-    InteractiveElement,
-    StepCondition,
-    StepErrorHandling,
-    StepResult,
-)
+    # Common types
+    from browseragentprotocol.types.common import (
+        AccessibilityNode,
+        ActionOptions,
+        BoundingBox,
+        ClickOptions,
+        ContentFormat,
+        Cookie,
+        Page,
+        PageStatus,
+        ScreenshotFormat,
+        ScreenshotOptions,
+        ScrollDirection,
+        ScrollOptions,
+        StorageState,
+        TypeOptions,
+        Viewport,
+        WaitUntilState,
+    )
 
-# Method types
-from browseragentprotocol.types.methods import (
-    ApprovalRequiredParams,
-    ApprovalRespondParams,
-    BrowserLaunchParams,
-    BrowserLaunchResult,
-    ContextCreateParams,
-    ContextCreateResult,
-    ContextListResult,
-    FrameInfo,
-    FrameListResult,
-    FrameSwitchParams,
-    FrameSwitchResult,
-    InitializeResult,
-    ObserveAccessibilityResult,
-    ObserveAriaSnapshotResult,
-    ObserveContentResult,
-    ObserveDOMResult,
-    ObserveElementResult,
-    ObservePDFResult,
-    ObserveScreenshotResult,
-    PageNavigateResult,
-    StreamChunkParams,
-    StreamEndParams,
-)
+    # Agent types
+    from browseragentprotocol.types.agent import (
+        ActionHint,
+        AgentActParams,
+        AgentActResult,
+        AgentExtractParams,
+        AgentExtractResult,
+        AgentObserveParams,
+        AgentObserveResult,
+        AnnotationOptions,
+        ExecutionStep,
+        InteractiveElement,
+        StepCondition,
+        StepErrorHandling,
+        StepResult,
+    )
 
-# Event types
-from browseragentprotocol.types.events import (
-    ConsoleEvent,
-    DialogEvent,
-    DownloadEvent,
-    NetworkEvent,
-    PageEvent,
-)
+    # Method types
+    from browseragentprotocol.types.methods import (
+        ApprovalRequiredParams,
+        ApprovalRespondParams,
+        BrowserLaunchParams,
+        BrowserLaunchResult,
+        ContextCreateParams,
+        ContextCreateResult,
+        ContextListResult,
+        FrameInfo,
+        FrameListResult,
+        FrameSwitchParams,
+        FrameSwitchResult,
+        InitializeResult,
+        ObserveAccessibilityResult,
+        ObserveAriaSnapshotResult,
+        ObserveContentResult,
+        ObserveDOMResult,
+        ObserveElementResult,
+        ObservePDFResult,
+        ObserveScreenshotResult,
+        PageNavigateResult,
+        StreamChunkParams,
+        StreamEndParams,
+    )
+
+    # Event types
+    from browseragentprotocol.types.events import (
+        ConsoleEvent,
+        DialogEvent,
+        DownloadEvent,
+        NetworkEvent,
+        PageEvent,
+    )
+
+# Public symbols are resolved lazily (PEP 562) so that importing the package,
+# or running ``bap version``, does not pull in pydantic, aiohttp and httpx.
+_LAZY_IMPORTS: dict[str, str] = {
+    # Main client classes
+    "BAPClient": "browseragentprotocol.client",
+    "BAPClientSync": "browseragentprotocol.sync_client",
+    # Transport layers
+    "WebSocketTransport": "browseragentprotocol.transport",
+    "SSETransport": "browseragentprotocol.sse",
+    # Context managers
+    "bap_client": "browseragentprotocol.context",
+    "bap_session": "browseragentprotocol.context",
+    # Errors
+    "BAPError": "browseragentprotocol.errors",
+    "BAPConnectionError": "browseragentprotocol.errors",
+    "BAPParseError": "browseragentprotocol.errors",
+    "BAPInvalidRequestError": "browseragentprotocol.errors",
+    "BAPMethodNotFoundError": "browseragentprotocol.errors",
+    "BAPInvalidParamsError": "browseragentprotocol.errors",
+    "BAPNotInitializedError": "browseragentprotocol.errors",
+    "BAPAlreadyInitializedError": "browseragentprotocol.errors",
+    "BAPBrowserNotLaunchedError": "browseragentprotocol.errors",
+    "BAPPageNotFoundError": "browseragentprotocol.errors",
+    "BAPElementNotFoundError": "browseragentprotocol.errors",
+    "BAPElementNotVisibleError": "browseragentprotocol.errors",
+    "BAPElementNotEnabledError": "browseragentprotocol.errors",
+    "BAPSelectorAmbiguousError": "browseragentprotocol.errors",
+    "BAPNavigationError": "browseragentprotocol.errors",
+    "BAPTimeoutError": "browseragentprotocol.errors",
+    "BAPActionError": "browseragentprotocol.errors",
+    "BAPTargetClosedError": "browseragentprotocol.errors",
+    "BAPExecutionContextDestroyedError": "browseragentprotocol.errors",
+    "BAPContextNotFoundError": "browseragentprotocol.errors",
+    "BAPResourceLimitExceededError": "browseragentprotocol.errors",
+    "BAPApprovalDeniedError": "browseragentprotocol.errors",
+    "BAPApprovalTimeoutError": "browseragentprotocol.errors",
+    "BAPApprovalRequiredError": "browseragentprotocol.errors",
+    "BAPFrameNotFoundError": "browseragentprotocol.errors",
+    "BAPDomainNotAllowedError": "browseragentprotocol.errors",
+    "BAPStreamNotFoundError": "browseragentprotocol.errors",
+    "BAPStreamCancelledError": "browseragentprotocol.errors",
+    # Selector factory functions
+    "css": "browseragentprotocol.types.selectors",
+    "xpath": "browseragentprotocol.types.selectors",
+    "role": "browseragentprotocol.types.selectors",
+    "text": "browseragentprotocol.types.selectors",
+    "label": "browseragentprotocol.types.selectors",
+    "placeholder": "browseragentprotocol.types.selectors",
+    "test_id": "browseragentprotocol.types.selectors",
+    "semantic": "browseragentprotocol.types.selectors",
+    "coords": "browseragentprotocol.types.selectors",
+    "ref": "browseragentprotocol.types.selectors",
+    "AriaRole": "browseragentprotocol.types.selectors",
+    "BAPSelector": "browseragentprotocol.types.selectors",
+    "CSSSelector": "browseragentprotocol.types.selectors",
+    "XPathSelector": "browseragentprotocol.types.selectors",
+    "RoleSelector": "browseragentprotocol.types.selectors",
+    "TextSelector": "browseragentprotocol.types.selectors",
+    "LabelSelector": "browseragentprotocol.types.selectors",
+    "PlaceholderSelector": "browseragentprotocol.types.selectors",
+    "TestIdSelector": "browseragentprotocol.types.selectors",
+    "SemanticSelector": "browseragentprotocol.types.selectors",
+    "CoordinatesSelector": "browseragentprotocol.types.selectors",
+    "RefSelector": "browseragentprotocol.types.selectors",
+    # Protocol types
+    "BAP_VERSION": "browseragentprotocol.types.protocol",
+    "ErrorCodes": "browseragentprotocol.types.protocol",
+    # Common types
+    "AccessibilityNode": "browseragentprotocol.types.common",
+    "ActionOptions": "browseragentprotocol.types.common",
+    "BoundingBox": "browseragentprotocol.types.common",
+    "ClickOptions": "browseragentprotocol.types.common",
+    "ContentFormat": "browseragentprotocol.types.common",
+    "Cookie": "browseragentprotocol.types.common",
+    "Page": "browseragentprotocol.types.common",
+    "PageStatus": "browseragentprotocol.types.common",
+    "ScreenshotFormat": "browseragentprotocol.types.common",
+    "ScreenshotOptions": "browseragentprotocol.types.common",
+    "ScrollDirection": "browseragentprotocol.types.common",
+    "ScrollOptions": "browseragentprotocol.types.common",
+    "StorageState": "browseragentprotocol.types.common",
+    "TypeOptions": "browseragentprotocol.types.common",
+    "Viewport": "browseragentprotocol.types.common",
+    "WaitUntilState": "browseragentprotocol.types.common",
+    # Agent types
+    "ActionHint": "browseragentprotocol.types.agent",
+    "AgentActParams": "browseragentprotocol.types.agent",
+    "AgentActResult": "browseragentprotocol.types.agent",
+    "AgentExtractParams": "browseragentprotocol.types.agent",
+    "AgentExtractResult": "browseragentprotocol.types.agent",
+    "AgentObserveParams": "browseragentprotocol.types.agent",
+    "AgentObserveResult": "browseragentprotocol.types.agent",
+    "AnnotationOptions": "browseragentprotocol.types.agent",
+    "ExecutionStep": "browseragentprotocol.types.agent",
+    "InteractiveElement": "browseragentprotocol.types.agent",
+    "StepCondition": "browseragentprotocol.types.agent",
+    "StepErrorHandling": "browseragentprotocol.types.agent",
+    "StepResult": "browseragentprotocol.types.agent",
+    # Method types
+    "ApprovalRequiredParams": "browseragentprotocol.types.methods",
+    "ApprovalRespondParams": "browseragentprotocol.types.methods",
+    "BrowserLaunchParams": "browseragentprotocol.types.methods",
+    "BrowserLaunchResult": "browseragentprotocol.types.methods",
+    "ContextCreateParams": "browseragentprotocol.types.methods",
+    "ContextCreateResult": "browseragentprotocol.types.methods",
+    "ContextListResult": "browseragentprotocol.types.methods",
+    "FrameInfo": "browseragentprotocol.types.methods",
+    "FrameListResult": "browseragentprotocol.types.methods",
+    "FrameSwitchParams": "browseragentprotocol.types.methods",
+    "FrameSwitchResult": "browseragentprotocol.types.methods",
+    "InitializeResult": "browseragentprotocol.types.methods",
+    "ObserveAccessibilityResult": "browseragentprotocol.types.methods",
+    "ObserveAriaSnapshotResult": "browseragentprotocol.types.methods",
+    "ObserveContentResult": "browseragentprotocol.types.methods",
+    "ObserveDOMResult": "browseragentprotocol.types.methods",
+    "ObserveElementResult": "browseragentprotocol.types.methods",
+    "ObservePDFResult": "browseragentprotocol.types.methods",
+    "ObserveScreenshotResult": "browseragentprotocol.types.methods",
+    "PageNavigateResult": "browseragentprotocol.types.methods",
+    "StreamChunkParams": "browseragentprotocol.types.methods",
+    "StreamEndParams": "browseragentprotocol.types.methods",
+    # Event types
+    "ConsoleEvent": "browseragentprotocol.types.events",
+    "DialogEvent": "browseragentprotocol.types.events",
+    "DownloadEvent": "browseragentprotocol.types.events",
+    "NetworkEvent": "browseragentprotocol.types.events",
+    "PageEvent": "browseragentprotocol.types.events",
+}
 
 __all__ = [
     # Version
@@ -333,3 +466,21 @@ __all__ = [
     "NetworkEvent",
     "PageEvent",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public symbols on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name)
+    # Bind every export of the module at once so later lookups skip __getattr__.
+    namespace = globals()
+    for export, source in _LAZY_IMPORTS.items():
+        if source == module_name:
+            namespace[export] = getattr(module, export)
+    return namespace[name]
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,34 @@
+"""
+JSON encoding shared by the client and the CLI.
+
+Uses orjson when it is installed (``pip install browser-agent-protocol[fast]``)
+and falls back to the standard library otherwise. Both paths produce compact
+JSON text.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+JSONDecodeError = json.JSONDecodeError
+
+dumps: Callable[[Any], str]
+loads: Callable[[str | bytes], Any]
+
+try:
+    import orjson
+except ImportError:
+    _encoder = json.JSONEncoder(separators=(",", ":"))
+
+    dumps = _encoder.encode
+    loads = json.loads
+else:
+    _orjson_dumps = orjson.dumps
+
+    def dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON string."""
+        return _orjson_dumps(obj).decode()
+
+    loads = orjson.loads
+
+__all__ = ["JSONDecodeError", "dumps", "loads"]
@@ -0,0 +1,3 @@
+"""Package version, kept in its own module so the CLI can read it cheaply."""
+
+__version__ = "0.9.0"
@@ -4,17 +4,52 @@ Command-line interface for BAP Python SDK.
 Provides utilities for connecting to BAP servers and testing connectivity.
 """
 
-import argparse
 import asyncio
-import json
 import sys
-from typing import Any
+from functools import cache
+from typing import TYPE_CHECKING, Any, NoReturn
 
-from browseragentprotocol import __version__, BAPClient
+from browseragentprotocol import _json
+from browseragentprotocol._version import __version__
 
+if TYPE_CHECKING:
+    import argparse
+
+    from browseragentprotocol.client import BAPClient
+    from browseragentprotocol.types.methods import InitializeResult
+
+# Flags understood by the argparse-free fast path: flag -> (dest, takes_value).
+_FAST_PATH_OPTIONS: dict[str, dict[str, tuple[str, bool]]] = {
+    "connect": {"--token": ("token", True), "--timeout": ("timeout", True)},
+    "info": {"--token": ("token", True), "--json": ("json_output", False)},
+    "repl": {"--token": ("token", True), "--timeout": ("timeout", True)},
+    "version": {},
+}
+
+_FAST_PATH_DEFAULTS: dict[str, dict[str, Any]] = {
+    "connect": {"token": None, "timeout": 10.0},
+    "info": {"token": None, "json_output": False},
+    "repl": {"token": None, "timeout": 10.0},
+    "version": {},
+}
+
+
+def _exit_with_error(message: str) -> NoReturn:
+    """Write ``message`` to stderr in a single call and exit with status 1."""
+    sys.stderr.write(f"{message}\n")
+    sys.exit(1)
+
+
+@cache
+def _build_parser() -> "argparse.ArgumentParser":
+    """
+    Build the full argparse parser (used for help output and error reporting).
+
+    Cached so that repeated in-process calls to ``main()`` (tests, embedding)
+    share one parser; parsing does not modify it.
+    """
+    import argparse
 
-def main() -> None:
-    """Main entry point for the BAP CLI."""
     parser = argparse.ArgumentParser(
         prog="bap",
         description="Browser Agent Protocol (BAP) Python SDK CLI",
@@ -67,82 +102,223 @@ def main() -> None:
         help="Output as JSON",
     )
 
+    # REPL command
+    repl_parser = subparsers.add_parser(
+        "repl",
+        help="Run several commands over a single connection",
+    )
+    repl_parser.add_argument(
+        "url",
+        help="WebSocket URL of the BAP server",
+    )
+    repl_parser.add_argument(
+        "--token",
+        help="Authentication token",
+    )
+    repl_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=10.0,
+        help="Connection timeout in seconds (default: 10)",
+    )
+
     # Version command (just prints version)
     subparsers.add_parser(
         "version",
         help="Show version information",
     )
 
-    args = parser.parse_args()
+    return parser
 
-    if args.command is None:
-        parser.print_help()
-        sys.exit(0)
 
-    if args.command == "version":
+def _parse_fast(argv: list[str]) -> dict[str, Any] | None:
+    """
+    Parse common invocations without importing argparse.
+
+    Returns None when the arguments need argparse: help requests, usage
+    errors, abbreviated flags, or anything else outside the simple grammar.
+    """
+    if argv == ["--version"]:
+        return {"command": "version"}
+    if not argv or argv[0] not in _FAST_PATH_OPTIONS:
+        return None
+
+    command, rest = argv[0], argv[1:]
+    options = _FAST_PATH_OPTIONS[command]
+    args: dict[str, Any] = {"command": command, **_FAST_PATH_DEFAULTS[command]}
+    positionals: list[str] = []
+
+    i = 0
+    while i < len(rest):
+        arg = rest[i]
+        i += 1
+        if not arg.startswith("-"):
+            positionals.append(arg)
+            continue
+
+        flag, has_value, value = arg.partition("=")
+        spec = options.get(flag)
+        if spec is None:
+            return None
+        dest, takes_value = spec
+        if not takes_value:
+            if has_value:
+                return None
+            args[dest] = True
+            continue
+        if not has_value:
+            if i >= len(rest) or rest[i].startswith("-"):
+                return None
+            value = rest[i]
+            i += 1
+        args[dest] = value
+
+    if command == "version":
+        return args if not positionals else None
+    if len(positionals) != 1:
+        return None
+    args["url"] = positionals[0]
+
+    if isinstance(args.get("timeout"), str):
+        try:
+            args["timeout"] = float(args["timeout"])
+        except ValueError:
+            return None
+
+    return args
+
+
+def main() -> None:
+    """Main entry point for the BAP CLI."""
+    argv = sys.argv[1:]
+    args = _parse_fast(argv)
+
+    if args is None:
+        parser = _build_parser()
+        args = vars(parser.parse_args(argv))
+        if args["command"] is None:
+            parser.print_help()
+            sys.exit(0)
+
+    command = args["command"]
+
+    if command == "version":
         print(f"browseragentprotocol {__version__}")
         sys.exit(0)
 
-    if args.command == "connect":
-        asyncio.run(connect_command(args.url, args.token, args.timeout))
-    elif args.command == "info":
-        asyncio.run(info_command(args.url, args.token, args.json_output))
+    if command == "connect":
+        asyncio.run(connect_command(args["url"], args["token"], args["timeout"]))
+    elif command == "info":
+        asyncio.run(info_command(args["url"], args["token"], args["json_output"]))
+    elif command == "repl":
+        asyncio.run(repl_command(args["url"], args["token"], args["timeout"]))
+
+
+def _print_server_info(result: "InitializeResult", json_output: bool) -> None:
+    """Print the server info returned by initialize."""
+    if json_output:
+        # InitializeResult mirrors the JSON shape we print, so let pydantic-core
+        # serialize it in a single pass instead of building an intermediate dict.
+        print(result.model_dump_json(by_alias=True, exclude_none=True, indent=2))
+    else:
+        # Build the whole report first and emit it with a single write.
+        lines = [
+            "BAP Server Information",
+            "=" * 40,
+            f"Protocol Version: {result.protocol_version}",
+            f"Server Name:      {result.server_info.name}",
+            f"Server Version:   {result.server_info.version}",
+        ]
+        if result.capabilities:
+            lines.append("\nCapabilities:")
+            caps = result.capabilities.model_dump(by_alias=True, exclude_none=True)
+            lines.extend(f"  {key}: {value}" for key, value in caps.items())
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def connect_command(url: str, token: str | None, timeout: float) -> None:
     """Test connection to a BAP server."""
+    from browseragentprotocol.client import BAPClient
+
     print(f"Connecting to {url}...")
 
     try:
         client = BAPClient(url, token=token, timeout=timeout)
         result = await client.connect()
-        print(f"Connected successfully!")
+        print("Connected successfully!")
         print(f"  Protocol version: {result.protocol_version}")
         print(f"  Server: {result.server_info.name} v{result.server_info.version}")
         await client.close()
     except Exception as e:
-        print(f"Connection failed: {e}", file=sys.stderr)
-        sys.exit(1)
+        _exit_with_error(f"Connection failed: {e}")
 
 
 async def info_command(url: str, token: str | None, json_output: bool) -> None:
     """Get server info and capabilities."""
+    from browseragentprotocol.client import BAPClient
+
     try:
         client = BAPClient(url, token=token, timeout=10.0)
         result = await client.connect()
+        _print_server_info(result, json_output)
+        await client.close()
+    except Exception as e:
+        _exit_with_error(_json.dumps({"error": str(e)}) if json_output else f"Error: {e}")
+
+
+_REPL_HELP = """Commands:
+  info [--json]  Show server info and capabilities
+  pages          List open pages
+  help           Show this help
+  exit, quit     Close the connection and exit"""
+
+
+async def _run_repl_line(client: "BAPClient", result: "InitializeResult", line: str) -> bool:
+    """Run a single REPL command. Returns False when the REPL should exit."""
+    command, *rest = line.split()
+    if command in ("exit", "quit"):
+        return False
+    if command == "help":
+        print(_REPL_HELP)
+    elif command == "info":
+        _print_server_info(result, "--json" in rest)
+    elif command == "pages":
+        pages = await client.list_pages()
+        print(_json.dumps(pages))
+    else:
+        print(f"Unknown command: {command} (type 'help' for a list)", file=sys.stderr)
+    return True
+
+
+async def repl_command(url: str, token: str | None, timeout: float) -> None:
+    """Run commands interactively over a single, reused connection."""
+    from browseragentprotocol.client import BAPClient
+
+    try:
+        client = BAPClient(url, token=token, timeout=timeout)
+        result = await client.connect()
+    except Exception as e:
+        _exit_with_error(f"Connection failed: {e}")
 
-        if json_output:
-            info: dict[str, Any] = {
-                "protocolVersion": result.protocol_version,
-                "serverInfo": {
-                    "name": result.server_info.name,
-                    "version": result.server_info.version,
-                },
-            }
-            if result.capabilities:
-                info["capabilities"] = result.capabilities.model_dump(
-                    by_alias=True, exclude_none=True
-                )
-            print(json.dumps(info, indent=2))
-        else:
-            print(f"BAP Server Information")
-            print(f"=" * 40)
-            print(f"Protocol Version: {result.protocol_version}")
-            print(f"Server Name:      {result.server_info.name}")
-            print(f"Server Version:   {result.server_info.version}")
-            if result.capabilities:
-                print(f"\nCapabilities:")
-                caps = result.capabilities.model_dump(by_alias=True, exclude_none=True)
-                for key, value in caps.items():
-                    print(f"  {key}: {value}")
+    print(f"Connected to {result.server_info.name} v{result.server_info.version}")
+    print("Type 'help' for a list of commands.")
 
+    try:
+        while True:
+            try:
+                line = await asyncio.to_thread(input, "bap> ")
+            except EOFError:
+                print()
+                break
+            if not line.strip():
+                continue
+            try:
+                if not await _run_repl_line(client, result, line):
+                    break
+            except Exception as e:
+                print(f"Error: {e}", file=sys.stderr)
+    finally:
         await client.close()
-    except Exception as e:
-        if json_output:
-            print(json.dumps({"error": str(e)}), file=sys.stderr)
-        else:
-            print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
 
 
 if __name__ == "__main__":
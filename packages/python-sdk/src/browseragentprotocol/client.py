@@ -5,20 +5,24 @@ Provides a fluent async API for connecting to BAP servers and controlling browse
 """
 
 import asyncio
-import json
+import base64
 import logging
+from enum import Enum
+from functools import cache, lru_cache
 from typing import Any, Callable, TypeVar, Union, Literal
-from urllib.parse import urlencode, urlparse, urlunparse
+from urllib.parse import quote
 
+from pydantic import TypeAdapter
+
+from browseragentprotocol import _json
 from browseragentprotocol.errors import BAPError, BAPPageNotFoundError
 from browseragentprotocol.transport import WebSocketTransport
 from browseragentprotocol.types.protocol import (
     BAP_VERSION,
     ErrorCodes,
     is_error_response,
-    create_request,
 )
-from browseragentprotocol.types.selectors import BAPSelector
+from browseragentprotocol.types.selectors import BAPSelector, _SelectorModel
 from browseragentprotocol.types.common import (
     ActionOptions,
     ClickOptions,
@@ -33,17 +37,13 @@ from browseragentprotocol.types.common import (
 )
 from browseragentprotocol.types.methods import (
     ApprovalRequiredParams,
-    ApprovalRespondParams,
     ApprovalRespondResult,
-    BrowserLaunchParams,
     BrowserLaunchResult,
-    ContextCreateParams,
     ContextCreateResult,
     ContextDestroyResult,
     ContextListResult,
     FrameListResult,
     FrameMainResult,
-    FrameSwitchParams,
     FrameSwitchResult,
     InitializeResult,
     ObserveAccessibilityResult,
@@ -59,29 +59,86 @@ from browseragentprotocol.types.methods import (
     StreamEndParams,
 )
 from browseragentprotocol.types.agent import (
-    AgentActParams,
     AgentActResult,
-    AgentExtractParams,
     AgentExtractResult,
-    AgentObserveParams,
     AgentObserveResult,
     ExecutionStep,
     StepCondition,
     StepErrorHandling,
 )
-from browseragentprotocol.types.events import (
-    ConsoleEvent,
-    DialogEvent,
-    DownloadEvent,
-    NetworkEvent,
-    PageEvent,
-)
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=1024)
+def _dump_selector(selector: _SelectorModel) -> dict[str, Any]:
+    """
+    Serialize a selector model, memoized by value.
+
+    Selector models are frozen and hashable, so the same selector used across
+    many actions is only dumped once. The returned dict is shared: do not mutate it.
+    """
+    return selector.model_dump(by_alias=True, exclude_none=True)
+
+
+_CLIENT_CLOSED = "Client closed"
+
+
+def _log_subscription_failure(future: "asyncio.Future[Any]") -> None:
+    """Done-callback for the events/subscribe request sent by connect()."""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is None:
+        return
+    # close() before the ack arrives fails the request; that is not a server error
+    if isinstance(error, BAPError) and error.message == _CLIENT_CLOSED:
+        return
+    logger.warning("Event subscription failed: %s", error)
+
+
+def _without(handlers: tuple[T, ...], handler: T) -> tuple[T, ...]:
+    """Return ``handlers`` minus the first occurrence of ``handler``."""
+    index = handlers.index(handler)
+    return handlers[:index] + handlers[index + 1 :]
+
+
+@lru_cache(maxsize=16)
+def _parse_version(version: str) -> tuple[int, ...]:
+    """Parse a dotted protocol version into integer parts."""
+    return tuple(int(part) for part in version.split("."))
+
+
+_CLIENT_VERSION_PARTS = _parse_version(BAP_VERSION)
+
+
+def _enum_value(value: Any) -> Any:
+    """Return the value of an enum member; pass plain values through unchanged."""
+    return value.value if isinstance(value, Enum) else value
+
+
+# Validators for notifications that can arrive many times per request (stream
+# chunks in particular), bound once instead of looked up on the class per message.
+_validate_stream_chunk = StreamChunkParams.model_validate
+_validate_stream_end = StreamEndParams.model_validate
+_validate_approval_required = ApprovalRequiredParams.model_validate
+
+# Typed notifications: method -> (validator, handler attribute, log label)
+_TYPED_NOTIFICATIONS: dict[str, tuple[Callable[[Any], Any], str, str]] = {
+    "stream/chunk": (_validate_stream_chunk, "_stream_chunk_handlers", "Stream chunk"),
+    "stream/end": (_validate_stream_end, "_stream_end_handlers", "Stream end"),
+    "approval/required": (_validate_approval_required, "_approval_handlers", "Approval"),
+}
+
+
+@cache
+def _cookie_list_adapter() -> TypeAdapter[list[Cookie]]:
+    """Validator for cookie lists, built on first use so importing stays cheap."""
+    return TypeAdapter(list[Cookie])
+
+
 class BAPClient:
     """
     BAP Client - Main interface for browser automation.
@@ -125,11 +182,9 @@ class BAPClient:
         """
         # Add token to URL if provided
         if token:
-            parsed = urlparse(url)
-            query = f"token={token}"
-            if parsed.query:
-                query = f"{parsed.query}&{query}"
-            url = urlunparse(parsed._replace(query=query))
+            base, hash_mark, fragment = url.partition("#")
+            separator = "&" if "?" in base else "?"
+            url = f"{base}{separator}token={quote(token, safe='')}{hash_mark}{fragment}"
 
         self._url = url
         self._token = token
@@ -140,30 +195,36 @@ class BAPClient:
 
         self._transport = WebSocketTransport(url)
         self._request_id = 0
-        self._pending_requests: dict[
-            int, tuple[asyncio.Future[Any], asyncio.TimerHandle | None]
-        ] = {}
+        self._pending_requests: dict[int, asyncio.Future[Any]] = {}
+        # request id -> (deadline, method). All requests share one timeout, so
+        # the dict's insertion order is also deadline order: a single timer armed
+        # for the first entry covers them all, and answered requests are removed
+        # in O(1) without leaving stale entries behind.
+        self._deadlines: dict[int, tuple[float, str]] = {}
+        self._timeout_handle: asyncio.TimerHandle | None = None
         self._initialized = False
         self._server_capabilities: dict[str, Any] | None = None
         self._active_page: str | None = None
 
-        # Event handlers
-        self._event_handlers: dict[str, list[Callable[..., None]]] = {
-            "page": [],
-            "console": [],
-            "network": [],
-            "dialog": [],
-            "download": [],
-            "close": [],
-            "error": [],
+        # Handlers are stored as tuples that are replaced (never mutated) on
+        # registration so dispatch can iterate them without copying.
+        self._event_handlers: dict[str, tuple[Callable[..., None], ...]] = {
+            "page": (),
+            "console": (),
+            "network": (),
+            "dialog": (),
+            "download": (),
+            "close": (),
+            "error": (),
         }
 
         # Stream handlers
-        self._stream_chunk_handlers: list[Callable[[StreamChunkParams], None]] = []
-        self._stream_end_handlers: list[Callable[[StreamEndParams], None]] = []
+        self._stream_chunk_handlers: tuple[Callable[[StreamChunkParams], None], ...] = ()
+        self._stream_chunk_raw_handlers: tuple[Callable[[dict[str, Any]], None], ...] = ()
+        self._stream_end_handlers: tuple[Callable[[StreamEndParams], None], ...] = ()
 
         # Approval handlers
-        self._approval_handlers: list[Callable[[ApprovalRequiredParams], None]] = []
+        self._approval_handlers: tuple[Callable[[ApprovalRequiredParams], None], ...] = ()
 
         # Setup transport callbacks
         self._transport.on_message = self._handle_message
@@ -214,8 +275,8 @@ class BAPClient:
 
         # Validate protocol version
         server_version = result.get("protocolVersion", "0.0.0")
-        server_parts = [int(x) for x in server_version.split(".")]
-        client_parts = [int(x) for x in BAP_VERSION.split(".")]
+        server_parts = _parse_version(server_version)
+        client_parts = _CLIENT_VERSION_PARTS
 
         if server_parts[0] != client_parts[0]:
             raise BAPError(
@@ -226,8 +287,10 @@ class BAPClient:
 
         if server_parts[1] < client_parts[1]:
             logger.warning(
-                f"Server protocol version ({server_version}) is older than client ({BAP_VERSION}). "
-                "Some features may not be available."
+                "Server protocol version (%s) is older than client (%s). "
+                "Some features may not be available.",
+                server_version,
+                BAP_VERSION,
             )
 
         self._initialized = True
@@ -236,31 +299,42 @@ class BAPClient:
         # Notify server we're initialized
         await self._notify("notifications/initialized")
 
-        # Subscribe to events
+        # Subscribe to events. The server registers the subscription as soon as
+        # it reads the frame, and reads frames in order, so connect() does not
+        # need to wait for the acknowledgement; a failure is logged instead.
         if self._events:
-            await self._request("events/subscribe", {"events": self._events})
+            subscription = await self._start_request(
+                "events/subscribe", {"events": self._events}
+            )
+            subscription.add_done_callback(_log_subscription_failure)
 
         return InitializeResult.model_validate(result)
 
     async def close(self) -> None:
         """Gracefully close the connection."""
-        if self._initialized:
-            try:
-                await self._request("shutdown", {"saveState": False, "closePages": True})
-            except Exception:
-                pass  # Ignore errors during shutdown
-
-        await self._transport.close()
-        self._initialized = False
-        self._server_capabilities = None
-
-        # Cancel all pending requests
-        for request_id, (future, timer) in list(self._pending_requests.items()):
-            if timer:
-                timer.cancel()
-            if not future.done():
-                future.set_exception(BAPError(ErrorCodes.ServerError, "Client closed"))
-        self._pending_requests.clear()
+        try:
+            if self._initialized:
+                try:
+                    await self._request("shutdown", {"saveState": False, "closePages": True})
+                except Exception:
+                    pass  # Ignore errors during shutdown
+        finally:
+            self._initialized = False
+            self._server_capabilities = None
+
+            # Fail all pending requests before awaiting anything else, so that
+            # waiters are released even if close() itself is cancelled.
+            if self._timeout_handle is not None:
+                self._timeout_handle.cancel()
+                self._timeout_handle = None
+            self._deadlines.clear()
+            pending, self._pending_requests = self._pending_requests, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(BAPError(ErrorCodes.ServerError, _CLIENT_CLOSED))
+
+            # Shielded so a cancelled close() still releases the socket and session.
+            await asyncio.shield(self._transport.close())
 
     @property
     def capabilities(self) -> dict[str, Any] | None:
@@ -367,7 +441,7 @@ class BAPClient:
             "url": url,
         }
         if wait_until is not None:
-            params["waitUntil"] = wait_until.value if hasattr(wait_until, 'value') else wait_until
+            params["waitUntil"] = _enum_value(wait_until)
         if timeout is not None:
             params["timeout"] = timeout
         if referer is not None:
@@ -386,7 +460,7 @@ class BAPClient:
         """Reload the current page."""
         params: dict[str, Any] = {"pageId": page_id or self._active_page}
         if wait_until is not None:
-            params["waitUntil"] = wait_until.value if hasattr(wait_until, 'value') else wait_until
+            params["waitUntil"] = _enum_value(wait_until)
         if timeout is not None:
             params["timeout"] = timeout
         await self._request("page/reload", params)
@@ -401,7 +475,7 @@ class BAPClient:
         """Go back in history."""
         params: dict[str, Any] = {"pageId": page_id or self._active_page}
         if wait_until is not None:
-            params["waitUntil"] = wait_until.value if hasattr(wait_until, 'value') else wait_until
+            params["waitUntil"] = _enum_value(wait_until)
         if timeout is not None:
             params["timeout"] = timeout
         await self._request("page/goBack", params)
@@ -416,7 +490,7 @@ class BAPClient:
         """Go forward in history."""
         params: dict[str, Any] = {"pageId": page_id or self._active_page}
         if wait_until is not None:
-            params["waitUntil"] = wait_until.value if hasattr(wait_until, 'value') else wait_until
+            params["waitUntil"] = _enum_value(wait_until)
         if timeout is not None:
             params["timeout"] = timeout
         await self._request("page/goForward", params)
@@ -719,6 +793,28 @@ class BAPClient:
         result = await self._request("observe/screenshot", params)
         return ObserveScreenshotResult.model_validate(result)
 
+    async def screenshot_bytes(
+        self,
+        options: ScreenshotOptions | dict[str, Any] | None = None,
+    ) -> bytes:
+        """
+        Capture a screenshot and return the decoded image bytes.
+
+        Skips building an ObserveScreenshotResult, so the base64 text is only
+        held until it has been decoded.
+
+        Args:
+            options: Screenshot options (fullPage, clip, format, quality)
+
+        Returns:
+            Image bytes in the requested format
+        """
+        params: dict[str, Any] = {"pageId": self._active_page}
+        if options is not None:
+            params["options"] = self._serialize_model(options)
+        result = await self._request("observe/screenshot", params)
+        return base64.b64decode(result["data"])
+
     async def accessibility(
         self,
         options: dict[str, Any] | None = None,
@@ -795,6 +891,22 @@ class BAPClient:
         result = await self._request("observe/pdf", params)
         return ObservePDFResult.model_validate(result)
 
+    async def pdf_bytes(
+        self,
+        options: dict[str, Any] | None = None,
+    ) -> bytes:
+        """
+        Generate PDF of the page and return the decoded document bytes.
+
+        Returns:
+            PDF bytes
+        """
+        params: dict[str, Any] = {"pageId": self._active_page}
+        if options is not None:
+            params["options"] = options
+        result = await self._request("observe/pdf", params)
+        return base64.b64decode(result["data"])
+
     async def content(
         self,
         format: ContentFormat | str = "text",
@@ -808,7 +920,7 @@ class BAPClient:
         Returns:
             Content result
         """
-        format_value = format.value if hasattr(format, 'value') else format
+        format_value = _enum_value(format)
         result = await self._request(
             "observe/content",
             {"pageId": self._active_page, "format": format_value},
@@ -838,6 +950,37 @@ class BAPClient:
         result = await self._request("observe/ariaSnapshot", params)
         return ObserveAriaSnapshotResult.model_validate(result)
 
+    async def observe_bundle(
+        self,
+        *,
+        screenshot: bool = True,
+        dom: bool = True,
+        aria: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Capture several observations of the active page concurrently.
+
+        The requests are sent back to back and awaited together, so the total
+        latency is that of the slowest observation rather than their sum.
+
+        Args:
+            screenshot: Include a screenshot (key "screenshot")
+            dom: Include a DOM snapshot (key "dom")
+            aria: Include an ARIA snapshot (key "aria")
+
+        Returns:
+            Dict mapping each requested key to its result model
+        """
+        observations: dict[str, Any] = {}
+        if screenshot:
+            observations["screenshot"] = self.screenshot()
+        if dom:
+            observations["dom"] = self.dom()
+        if aria:
+            observations["aria"] = self.aria_snapshot()
+        results = await asyncio.gather(*observations.values())
+        return dict(zip(observations, results, strict=True))
+
     # =========================================================================
     # Storage Methods
     # =========================================================================
@@ -857,7 +1000,7 @@ class BAPClient:
     async def get_cookies(self, urls: list[str] | None = None) -> list[Cookie]:
         """Get cookies."""
         result = await self._request("storage/getCookies", {"urls": urls})
-        return [Cookie.model_validate(c) for c in result.get("cookies", [])]
+        return _cookie_list_adapter().validate_python(result.get("cookies", []))
 
     async def set_cookies(self, cookies: list[Cookie | dict[str, Any]]) -> None:
         """Set cookies."""
@@ -1213,8 +1356,34 @@ class BAPClient:
         Returns:
             Unsubscribe function
         """
-        self._stream_chunk_handlers.append(handler)
-        return lambda: self._stream_chunk_handlers.remove(handler)
+        self._stream_chunk_handlers += (handler,)
+
+        def unsubscribe() -> None:
+            self._stream_chunk_handlers = _without(self._stream_chunk_handlers, handler)
+
+        return unsubscribe
+
+    def on_stream_chunk_raw(
+        self, handler: Callable[[dict[str, Any]], None]
+    ) -> Callable[[], None]:
+        """
+        Register a handler for stream chunks that receives the raw params dict.
+
+        Raw handlers skip model validation, so chunks are cheaper to deliver
+        when only a few fields (usually ``data``) are needed. Keys use the
+        wire names (``streamId``, ``index``, ``data``, ``offset``, ``size``).
+
+        Returns:
+            Unsubscribe function
+        """
+        self._stream_chunk_raw_handlers += (handler,)
+
+        def unsubscribe() -> None:
+            self._stream_chunk_raw_handlers = _without(
+                self._stream_chunk_raw_handlers, handler
+            )
+
+        return unsubscribe
 
     def on_stream_end(
         self, handler: Callable[[StreamEndParams], None]
@@ -1225,8 +1394,12 @@ class BAPClient:
         Returns:
             Unsubscribe function
         """
-        self._stream_end_handlers.append(handler)
-        return lambda: self._stream_end_handlers.remove(handler)
+        self._stream_end_handlers += (handler,)
+
+        def unsubscribe() -> None:
+            self._stream_end_handlers = _without(self._stream_end_handlers, handler)
+
+        return unsubscribe
 
     # =========================================================================
     # Approval Methods (Human-in-the-Loop)
@@ -1241,8 +1414,12 @@ class BAPClient:
         Returns:
             Unsubscribe function
         """
-        self._approval_handlers.append(handler)
-        return lambda: self._approval_handlers.remove(handler)
+        self._approval_handlers += (handler,)
+
+        def unsubscribe() -> None:
+            self._approval_handlers = _without(self._approval_handlers, handler)
+
+        return unsubscribe
 
     async def respond_to_approval(
         self,
@@ -1287,10 +1464,12 @@ class BAPClient:
         Returns:
             Unsubscribe function
         """
-        if event not in self._event_handlers:
-            self._event_handlers[event] = []
-        self._event_handlers[event].append(handler)
-        return lambda: self._event_handlers[event].remove(handler)
+        self._event_handlers[event] = (*self._event_handlers.get(event, ()), handler)
+
+        def unsubscribe() -> None:
+            self._event_handlers[event] = _without(self._event_handlers[event], handler)
+
+        return unsubscribe
 
     # =========================================================================
     # Static Helpers
@@ -1331,7 +1510,7 @@ class BAPClient:
         if condition is not None:
             step_dict["condition"] = condition
         if on_error is not None:
-            step_dict["onError"] = on_error.value if hasattr(on_error, 'value') else on_error
+            step_dict["onError"] = _enum_value(on_error)
         if max_retries is not None:
             step_dict["maxRetries"] = max_retries
         if retry_delay is not None:
@@ -1345,9 +1524,9 @@ class BAPClient:
     def _handle_message(self, message: str) -> None:
         """Handle incoming WebSocket message."""
         try:
-            data = json.loads(message)
-        except json.JSONDecodeError:
-            logger.error(f"Failed to parse message: {message[:100]}")
+            data = _json.loads(message)
+        except _json.JSONDecodeError:
+            logger.error("Failed to parse message: %.100s", message)
             return
 
         # Check if it's a response (has id) or notification (has method, no id)
@@ -1360,12 +1539,11 @@ class BAPClient:
         """Handle a JSON-RPC response."""
         request_id = data.get("id")
         if request_id not in self._pending_requests:
-            logger.warning(f"Received response for unknown request: {request_id}")
+            logger.warning("Received response for unknown request: %s", request_id)
             return
 
-        future, timer = self._pending_requests.pop(request_id)
-        if timer:
-            timer.cancel()
+        future = self._pending_requests.pop(request_id)
+        del self._deadlines[request_id]
 
         if future.done():
             return
@@ -1381,100 +1559,112 @@ class BAPClient:
         method = data.get("method", "")
         params = data.get("params", {})
 
-        # Handle stream notifications
         if method == "stream/chunk":
-            chunk = StreamChunkParams.model_validate(params)
-            for handler in self._stream_chunk_handlers:
-                try:
-                    handler(chunk)
-                except Exception as e:
-                    logger.error(f"Stream chunk handler error: {e}")
-            return
-
-        if method == "stream/end":
-            end = StreamEndParams.model_validate(params)
-            for handler in self._stream_end_handlers:
+            for raw_handler in self._stream_chunk_raw_handlers:
                 try:
-                    handler(end)
+                    raw_handler(params)
                 except Exception as e:
-                    logger.error(f"Stream end handler error: {e}")
-            return
-
-        # Handle approval notifications
-        if method == "approval/required":
-            approval = ApprovalRequiredParams.model_validate(params)
-            for handler in self._approval_handlers:
+                    logger.error("Raw stream chunk handler error: %s", e)
+
+        # Handle stream and approval notifications, validating only when
+        # someone is listening
+        typed = _TYPED_NOTIFICATIONS.get(method)
+        if typed is not None:
+            validate, attribute, label = typed
+            handlers = getattr(self, attribute)
+            if not handlers:
+                return
+            notification = validate(params)
+            for handler in handlers:
                 try:
-                    handler(approval)
+                    handler(notification)
                 except Exception as e:
-                    logger.error(f"Approval handler error: {e}")
+                    logger.error("%s handler error: %s", label, e)
             return
 
         # Handle event notifications
-        if method.startswith("event/"):
-            event_type = method.split("/")[1]
-        else:
-            event_type = method
+        event_type = method.removeprefix("event/")
 
-        if event_type in self._event_handlers:
-            for handler in self._event_handlers[event_type]:
-                try:
-                    handler(params)
-                except Exception as e:
-                    logger.error(f"Event handler error: {e}")
+        for handler in self._event_handlers.get(event_type, ()):
+            try:
+                handler(params)
+            except Exception as e:
+                logger.error("Event handler error: %s", e)
 
     def _handle_close(self) -> None:
         """Handle WebSocket close."""
-        for handler in self._event_handlers.get("close", []):
+        for handler in self._event_handlers["close"]:
             try:
                 handler()
             except Exception as e:
-                logger.error(f"Close handler error: {e}")
+                logger.error("Close handler error: %s", e)
 
     def _handle_error(self, error: Exception) -> None:
         """Handle WebSocket error."""
-        for handler in self._event_handlers.get("error", []):
+        for handler in self._event_handlers["error"]:
             try:
                 handler(error)
             except Exception as e:
-                logger.error(f"Error handler error: {e}")
+                logger.error("Error handler error: %s", e)
 
     async def _request(self, method: str, params: dict[str, Any]) -> Any:
         """Send a request and wait for response."""
+        return await (await self._start_request(method, params))
+
+    async def _start_request(
+        self, method: str, params: dict[str, Any]
+    ) -> asyncio.Future[Any]:
+        """Send a request and return the future that resolves to its result."""
         self._request_id += 1
         request_id = self._request_id
 
-        request = create_request(request_id, method, params)
+        # Built inline rather than through create_request(): params is always
+        # given here, so the envelope is a single dict literal.
+        request = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
 
         loop = asyncio.get_running_loop()
         future: asyncio.Future[Any] = loop.create_future()
 
-        # Set up timeout
-        def on_timeout() -> None:
-            if request_id in self._pending_requests:
-                f, _ = self._pending_requests.pop(request_id)
-                if not f.done():
-                    f.set_exception(
-                        BAPError(
-                            ErrorCodes.Timeout,
-                            f"Request timeout: {method}",
-                            retryable=True,
-                        )
-                    )
-
-        timer = loop.call_later(self._timeout, on_timeout)
-        self._pending_requests[request_id] = (future, timer)
+        self._pending_requests[request_id] = future
+        deadline = loop.time() + self._timeout
+        self._deadlines[request_id] = (deadline, method)
+        if self._timeout_handle is None:
+            self._timeout_handle = loop.call_at(deadline, self._expire_requests)
 
         try:
-            await self._transport.send(json.dumps(request))
-            return await future
+            await self._transport.send(_json.dumps(request))
         except Exception:
             # Clean up on error
-            if request_id in self._pending_requests:
-                _, t = self._pending_requests.pop(request_id)
-                if t:
-                    t.cancel()
+            if self._pending_requests.pop(request_id, None) is not None:
+                del self._deadlines[request_id]
             raise
+        return future
+
+    def _expire_requests(self) -> None:
+        """Fail requests whose deadline has passed and re-arm the shared timer."""
+        self._timeout_handle = None
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        deadlines = self._deadlines
+
+        expired: list[tuple[int, str]] = []
+        for request_id, (deadline, method) in deadlines.items():
+            if deadline > now:
+                self._timeout_handle = loop.call_at(deadline, self._expire_requests)
+                break
+            expired.append((request_id, method))
+
+        for request_id, method in expired:
+            del deadlines[request_id]
+            future = self._pending_requests.pop(request_id)
+            if not future.done():
+                future.set_exception(
+                    BAPError(
+                        ErrorCodes.Timeout,
+                        f"Request timeout: {method}",
+                        retryable=True,
+                    )
+                )
 
     async def _notify(self, method: str, params: dict[str, Any] | None = None) -> None:
         """Send a notification (no response expected)."""
@@ -1484,18 +1674,25 @@ class BAPClient:
         }
         if params is not None:
             notification["params"] = params
-        await self._transport.send(json.dumps(notification))
+        await self._transport.send(_json.dumps(notification))
 
     def _serialize_selector(
         self, selector: BAPSelector | dict[str, Any]
     ) -> dict[str, Any]:
         """Serialize a selector to dict."""
+        if isinstance(selector, _SelectorModel):
+            return _dump_selector(selector)
+        if type(selector) is dict:
+            return selector
         if hasattr(selector, "model_dump"):
-            return selector.model_dump(by_alias=True, exclude_none=True)
+            return selector.model_dump(by_alias=True, exclude_none=True)  # type: ignore[no-any-return]
         return dict(selector)
 
     def _serialize_model(self, model: Any) -> dict[str, Any]:
         """Serialize a Pydantic model or dict to dict."""
+        if type(model) is dict:
+            # Plain dicts are only encoded, never mutated, so no copy is needed.
+            return model
         if hasattr(model, "model_dump"):
             return model.model_dump(by_alias=True, exclude_none=True)
         return dict(model)
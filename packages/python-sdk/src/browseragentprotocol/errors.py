@@ -4,6 +4,7 @@ BAP error class hierarchy.
 Matches the TypeScript definitions in @browseragentprotocol/protocol.
 """
 
+from collections.abc import Callable
 from typing import Any
 
 from browseragentprotocol.types.protocol import ErrorCodes, JSONRPCError
@@ -120,8 +121,21 @@ class BAPParseError(BAPError):
 class BAPInvalidRequestError(BAPError):
     """Invalid request error."""
 
-    def __init__(self, message: str, *, details: dict[str, Any] | None = None):
-        super().__init__(ErrorCodes.InvalidRequest, message, details=details)
+    def __init__(
+        self,
+        message: str,
+        *,
+        retryable: bool = False,
+        retry_after_ms: int | None = None,
+        details: dict[str, Any] | None = None,
+    ):
+        super().__init__(
+            ErrorCodes.InvalidRequest,
+            message,
+            retryable=retryable,
+            retry_after_ms=retry_after_ms,
+            details=details,
+        )
 
 
 class BAPMethodNotFoundError(BAPError):
@@ -134,8 +148,21 @@ class BAPMethodNotFoundError(BAPError):
 class BAPInvalidParamsError(BAPError):
     """Invalid parameters error."""
 
-    def __init__(self, message: str, *, details: dict[str, Any] | None = None):
-        super().__init__(ErrorCodes.InvalidParams, message, details=details)
+    def __init__(
+        self,
+        message: str,
+        *,
+        retryable: bool = False,
+        retry_after_ms: int | None = None,
+        details: dict[str, Any] | None = None,
+    ):
+        super().__init__(
+            ErrorCodes.InvalidParams,
+            message,
+            retryable=retryable,
+            retry_after_ms=retry_after_ms,
+            details=details,
+        )
 
 
 # =============================================================================
@@ -477,6 +504,74 @@ class BAPStreamCancelledError(BAPError):
 # =============================================================================
 
 
+_ErrorBuilder = Callable[[str, bool, int | None, dict[str, Any]], BAPError]
+
+# Passed to builders when no details were given, so they can call .get()
+# without a None check. Shared and read-only: builders never store or mutate it.
+_NO_DETAILS: dict[str, Any] = {}
+
+# code -> builder(message, retryable, retry_after_ms, details). Built once at
+# import; details is never None here (create_error_from_code passes _NO_DETAILS).
+_ERROR_BUILDERS: dict[int, _ErrorBuilder] = {
+    ErrorCodes.ParseError: lambda m, r, ra, d: BAPParseError(m),
+    ErrorCodes.InvalidRequest: lambda m, r, ra, d: BAPInvalidRequestError(
+        m, retryable=r, retry_after_ms=ra, details=None if d is _NO_DETAILS else d
+    ),
+    ErrorCodes.MethodNotFound: lambda m, r, ra, d: BAPMethodNotFoundError(m),
+    ErrorCodes.InvalidParams: lambda m, r, ra, d: BAPInvalidParamsError(
+        m, retryable=r, retry_after_ms=ra, details=None if d is _NO_DETAILS else d
+    ),
+    ErrorCodes.NotInitialized: lambda m, r, ra, d: BAPNotInitializedError(),
+    ErrorCodes.AlreadyInitialized: lambda m, r, ra, d: BAPAlreadyInitializedError(),
+    ErrorCodes.BrowserNotLaunched: lambda m, r, ra, d: BAPBrowserNotLaunchedError(),
+    ErrorCodes.Timeout: lambda m, r, ra, d: BAPTimeoutError(m, timeout=d.get("timeout")),
+    ErrorCodes.TargetClosed: lambda m, r, ra, d: BAPTargetClosedError(d.get("target", "target")),
+    ErrorCodes.ExecutionContextDestroyed: (
+        lambda m, r, ra, d: BAPExecutionContextDestroyedError()
+    ),
+    ErrorCodes.ApprovalDenied: lambda m, r, ra, d: BAPApprovalDeniedError(
+        d.get("reason"), d.get("rule")
+    ),
+    ErrorCodes.FrameNotFound: lambda m, r, ra, d: BAPFrameNotFoundError(d.get("identifier")),
+    ErrorCodes.StreamNotFound: lambda m, r, ra, d: BAPStreamNotFoundError(
+        d.get("streamId", "unknown")
+    ),
+    ErrorCodes.StreamCancelled: lambda m, r, ra, d: BAPStreamCancelledError(
+        d.get("streamId", "unknown")
+    ),
+    ErrorCodes.PageNotFound: lambda m, r, ra, d: BAPPageNotFoundError(d.get("pageId", "unknown")),
+    ErrorCodes.ElementNotFound: lambda m, r, ra, d: BAPElementNotFoundError(
+        d.get("selector"), retryable=r, retry_after_ms=ra or 500
+    ),
+    ErrorCodes.ElementNotVisible: lambda m, r, ra, d: BAPElementNotVisibleError(d.get("selector")),
+    ErrorCodes.ElementNotEnabled: lambda m, r, ra, d: BAPElementNotEnabledError(d.get("selector")),
+    ErrorCodes.SelectorAmbiguous: lambda m, r, ra, d: BAPSelectorAmbiguousError(
+        d.get("selector"), d.get("count", 0)
+    ),
+    ErrorCodes.NavigationFailed: lambda m, r, ra, d: BAPNavigationError(
+        m, url=d.get("url"), status=d.get("status"), retryable=r
+    ),
+    ErrorCodes.ActionFailed: lambda m, r, ra, d: BAPActionError(
+        d.get("action", "action"), m, selector=d.get("selector"), retryable=r
+    ),
+    ErrorCodes.ContextNotFound: lambda m, r, ra, d: BAPContextNotFoundError(
+        d.get("contextId", "unknown")
+    ),
+    ErrorCodes.ResourceLimitExceeded: lambda m, r, ra, d: BAPResourceLimitExceededError(
+        d.get("resource", "resource"), d.get("limit", 0), d.get("current", 0)
+    ),
+    ErrorCodes.ApprovalTimeout: lambda m, r, ra, d: BAPApprovalTimeoutError(
+        d.get("timeout", 60000)
+    ),
+    ErrorCodes.ApprovalRequired: lambda m, r, ra, d: BAPApprovalRequiredError(
+        d.get("requestId", "unknown"), d.get("rule", "unknown")
+    ),
+    ErrorCodes.DomainNotAllowed: lambda m, r, ra, d: BAPDomainNotAllowedError(
+        d.get("domain", "unknown")
+    ),
+}
+
+
 def create_error_from_code(
     code: int,
     message: str,
@@ -486,104 +581,11 @@ def create_error_from_code(
     details: dict[str, Any] | None = None,
 ) -> BAPError:
     """Create an appropriate error instance for a given error code."""
-    error_classes: dict[int, type[BAPError]] = {
-        ErrorCodes.ParseError: BAPParseError,
-        ErrorCodes.InvalidRequest: BAPInvalidRequestError,
-        ErrorCodes.MethodNotFound: BAPMethodNotFoundError,
-        ErrorCodes.InvalidParams: BAPInvalidParamsError,
-        ErrorCodes.NotInitialized: BAPNotInitializedError,
-        ErrorCodes.AlreadyInitialized: BAPAlreadyInitializedError,
-        ErrorCodes.BrowserNotLaunched: BAPBrowserNotLaunchedError,
-        ErrorCodes.Timeout: BAPTimeoutError,
-        ErrorCodes.TargetClosed: BAPTargetClosedError,
-        ErrorCodes.ExecutionContextDestroyed: BAPExecutionContextDestroyedError,
-        ErrorCodes.ApprovalDenied: BAPApprovalDeniedError,
-        ErrorCodes.FrameNotFound: BAPFrameNotFoundError,
-        ErrorCodes.StreamNotFound: BAPStreamNotFoundError,
-        ErrorCodes.StreamCancelled: BAPStreamCancelledError,
-    }
-
-    # For specific error codes, create the specialized error
-    if code in error_classes:
-        error_cls = error_classes[code]
-        # These errors have special constructors
-        if code == ErrorCodes.ParseError:
-            return BAPParseError(message)
-        elif code == ErrorCodes.MethodNotFound:
-            return BAPMethodNotFoundError(message)
-        elif code == ErrorCodes.NotInitialized:
-            return BAPNotInitializedError()
-        elif code == ErrorCodes.AlreadyInitialized:
-            return BAPAlreadyInitializedError()
-        elif code == ErrorCodes.BrowserNotLaunched:
-            return BAPBrowserNotLaunchedError()
-        elif code == ErrorCodes.Timeout:
-            return BAPTimeoutError(message, timeout=details.get("timeout") if details else None)
-        elif code == ErrorCodes.TargetClosed:
-            return BAPTargetClosedError(details.get("target", "target") if details else "target")
-        elif code == ErrorCodes.ExecutionContextDestroyed:
-            return BAPExecutionContextDestroyedError()
-        elif code == ErrorCodes.ApprovalDenied:
-            return BAPApprovalDeniedError(
-                details.get("reason") if details else None,
-                details.get("rule") if details else None,
-            )
-        elif code == ErrorCodes.FrameNotFound:
-            return BAPFrameNotFoundError(details.get("identifier") if details else None)
-        elif code == ErrorCodes.StreamNotFound:
-            return BAPStreamNotFoundError(details.get("streamId", "unknown") if details else "unknown")
-        elif code == ErrorCodes.StreamCancelled:
-            return BAPStreamCancelledError(details.get("streamId", "unknown") if details else "unknown")
-
-    # Handle other specific cases
-    if code == ErrorCodes.PageNotFound:
-        return BAPPageNotFoundError(details.get("pageId", "unknown") if details else "unknown")
-    elif code == ErrorCodes.ElementNotFound:
-        return BAPElementNotFoundError(
-            details.get("selector") if details else None,
-            retryable=retryable,
-            retry_after_ms=retry_after_ms or 500,
-        )
-    elif code == ErrorCodes.ElementNotVisible:
-        return BAPElementNotVisibleError(details.get("selector") if details else None)
-    elif code == ErrorCodes.ElementNotEnabled:
-        return BAPElementNotEnabledError(details.get("selector") if details else None)
-    elif code == ErrorCodes.SelectorAmbiguous:
-        return BAPSelectorAmbiguousError(
-            details.get("selector") if details else None,
-            details.get("count", 0) if details else 0,
-        )
-    elif code == ErrorCodes.NavigationFailed:
-        return BAPNavigationError(
-            message,
-            url=details.get("url") if details else None,
-            status=details.get("status") if details else None,
-            retryable=retryable,
-        )
-    elif code == ErrorCodes.ActionFailed:
-        return BAPActionError(
-            details.get("action", "action") if details else "action",
-            message,
-            selector=details.get("selector") if details else None,
-            retryable=retryable,
-        )
-    elif code == ErrorCodes.ContextNotFound:
-        return BAPContextNotFoundError(details.get("contextId", "unknown") if details else "unknown")
-    elif code == ErrorCodes.ResourceLimitExceeded:
-        return BAPResourceLimitExceededError(
-            details.get("resource", "resource") if details else "resource",
-            details.get("limit", 0) if details else 0,
-            details.get("current", 0) if details else 0,
-        )
-    elif code == ErrorCodes.ApprovalTimeout:
-        return BAPApprovalTimeoutError(details.get("timeout", 60000) if details else 60000)
-    elif code == ErrorCodes.ApprovalRequired:
-        return BAPApprovalRequiredError(
-            details.get("requestId", "unknown") if details else "unknown",
-            details.get("rule", "unknown") if details else "unknown",
+    builder = _ERROR_BUILDERS.get(code)
+    if builder is not None:
+        return builder(
+            message, retryable, retry_after_ms, _NO_DETAILS if details is None else details
         )
-    elif code == ErrorCodes.DomainNotAllowed:
-        return BAPDomainNotAllowedError(details.get("domain", "unknown") if details else "unknown")
 
     # Default: create a base BAPError
     return BAPError(
@@ -6,15 +6,19 @@ where WebSockets are not available, following MCP SDK patterns.
 """
 
 import asyncio
-import json
 import logging
 from typing import Any, Callable
 
 import httpx
 from httpx_sse import aconnect_sse
 
+from browseragentprotocol import _json
+from browseragentprotocol.errors import BAPConnectionError
+
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class SSETransport:
     """
@@ -30,6 +34,7 @@ class SSETransport:
         *,
         headers: dict[str, str] | None = None,
         timeout: float = 30.0,
+        http2: bool = False,
     ):
         """
         Initialize the SSE transport.
@@ -39,10 +44,13 @@ class SSETransport:
                       (e.g., "http://localhost:9222")
             headers: Additional HTTP headers (e.g., for authentication)
             timeout: Request timeout in seconds
+            http2: Negotiate HTTP/2 so the event stream and POSTs share one
+                   connection (https only; requires the ``http2`` extra)
         """
         self.base_url = base_url.rstrip("/")
         self.headers = headers or {}
         self.timeout = timeout
+        self.http2 = http2
 
         self._client: httpx.AsyncClient | None = None
         self._sse_task: asyncio.Task[None] | None = None
@@ -66,6 +74,7 @@ class SSETransport:
             base_url=self.base_url,
             headers=self.headers,
             timeout=self.timeout,
+            http2=self.http2,
         )
 
         # Start listening for SSE events
@@ -101,30 +110,33 @@ class SSETransport:
             if self.on_close and not self._is_closing:
                 self.on_close()
 
-    async def send(self, message: str) -> None:
+    async def send(self, message: str | bytes) -> None:
         """
         Send a message to the server via HTTP POST.
 
         Args:
-            message: JSON string to send
+            message: JSON text to send, as str or already-encoded UTF-8 bytes
 
         Raises:
-            Exception: If not connected or request fails
+            BAPConnectionError: If not connected or the request fails
         """
         if self._client is None:
-            raise Exception("SSE transport not connected")
+            raise BAPConnectionError("SSE transport not connected")
 
         try:
             response = await self._client.post(
                 "/message",
                 content=message,
-                headers={"Content-Type": "application/json"},
+                headers=_JSON_HEADERS,
             )
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
-            raise Exception(f"HTTP error: {e.response.status_code}") from e
-        except Exception as e:
-            raise Exception(f"Failed to send message: {e}") from e
+            raise BAPConnectionError(
+                f"HTTP error: {e.response.status_code}",
+                details={"status": e.response.status_code},
+            ) from e
+        except httpx.HTTPError as e:
+            raise BAPConnectionError(f"Failed to send message: {e}") from e
 
     async def send_json(self, data: dict[str, Any]) -> None:
         """
@@ -133,7 +145,7 @@ class SSETransport:
         Args:
             data: Dictionary to send as JSON
         """
-        await self.send(json.dumps(data))
+        await self.send(_json.dumps(data))
 
     async def close(self) -> None:
         """Close the SSE connection."""
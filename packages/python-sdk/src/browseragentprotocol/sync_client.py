@@ -5,7 +5,9 @@ Provides a blocking API for use in non-async contexts.
 """
 
 import asyncio
-from typing import Any, Callable, Literal
+import threading
+from collections.abc import Coroutine
+from typing import Any, Callable, Literal, TypeVar
 
 from browseragentprotocol.client import BAPClient
 from browseragentprotocol.types.selectors import BAPSelector
@@ -48,6 +50,15 @@ from browseragentprotocol.types.agent import (
     ExecutionStep,
 )
 
+try:
+    import uvloop
+except ImportError:
+    _new_event_loop: Callable[[], asyncio.AbstractEventLoop] = asyncio.new_event_loop
+else:
+    _new_event_loop = uvloop.new_event_loop
+
+T = TypeVar("T")
+
 
 class BAPClientSync:
     """
@@ -98,21 +109,59 @@ class BAPClientSync:
             events=events,
         )
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._loop_lock = threading.Lock()
 
     def _get_loop(self) -> asyncio.AbstractEventLoop:
-        """Get or create an event loop."""
-        if self._loop is None or self._loop.is_closed():
-            try:
-                self._loop = asyncio.get_running_loop()
-            except RuntimeError:
-                self._loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self._loop)
-        return self._loop
-
-    def _run(self, coro: Any) -> Any:
-        """Run a coroutine in the event loop."""
-        loop = self._get_loop()
-        return loop.run_until_complete(coro)
+        """Get the client's event loop, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                # The loop runs for the client's lifetime on its own thread, so
+                # the connection keeps receiving messages between calls and
+                # calls work from any thread, even one with a running loop.
+                loop = _new_event_loop()
+                if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+                    # Tasks that finish without suspending never get scheduled
+                    loop.set_task_factory(asyncio.eager_task_factory)
+                self._loop_thread = threading.Thread(
+                    target=loop.run_forever, name="bap-client-sync", daemon=True
+                )
+                self._loop_thread.start()
+                self._loop = loop
+            return self._loop
+
+    def _check_not_loop_thread(self) -> None:
+        """Refuse blocking calls from client callbacks, which run on the loop thread."""
+        if threading.current_thread() is self._loop_thread:
+            # Waiting on the loop from its own thread would deadlock it
+            raise RuntimeError("BAPClientSync methods cannot be called from client callbacks")
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the client's event loop and wait for its result."""
+        try:
+            self._check_not_loop_thread()
+        except RuntimeError:
+            coro.close()
+            raise
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+        try:
+            return future.result()
+        except BaseException:
+            # Interrupted (e.g. KeyboardInterrupt): don't leave the call running
+            future.cancel()
+            raise
+
+    def _stop_loop(self) -> None:
+        """Stop the loop thread and close the loop."""
+        self._check_not_loop_thread()
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
 
     # =========================================================================
     # Context Manager
@@ -137,7 +186,11 @@ class BAPClientSync:
 
     def close(self) -> None:
         """Gracefully close the connection."""
-        self._run(self._async_client.close())
+        self._check_not_loop_thread()
+        try:
+            self._run(self._async_client.close())
+        finally:
+            self._stop_loop()
 
     @property
     def capabilities(self) -> dict[str, Any] | None:
@@ -344,6 +397,13 @@ class BAPClientSync:
         """Capture a screenshot."""
         return self._run(self._async_client.screenshot(options))
 
+    def screenshot_bytes(
+        self,
+        options: ScreenshotOptions | dict[str, Any] | None = None,
+    ) -> bytes:
+        """Capture a screenshot and return the decoded image bytes."""
+        return self._run(self._async_client.screenshot_bytes(options))
+
     def accessibility(
         self,
         options: dict[str, Any] | None = None,
@@ -373,6 +433,13 @@ class BAPClientSync:
         """Generate PDF of the page."""
         return self._run(self._async_client.pdf(options))
 
+    def pdf_bytes(
+        self,
+        options: dict[str, Any] | None = None,
+    ) -> bytes:
+        """Generate PDF of the page and return the decoded document bytes."""
+        return self._run(self._async_client.pdf_bytes(options))
+
     def content(
         self,
         format: ContentFormat | str = "text",
@@ -388,6 +455,18 @@ class BAPClientSync:
         """Get ARIA snapshot."""
         return self._run(self._async_client.aria_snapshot(selector, options))
 
+    def observe_bundle(
+        self,
+        *,
+        screenshot: bool = True,
+        dom: bool = True,
+        aria: bool = True,
+    ) -> dict[str, Any]:
+        """Capture several observations of the active page concurrently."""
+        return self._run(
+            self._async_client.observe_bundle(screenshot=screenshot, dom=dom, aria=aria)
+        )
+
     # =========================================================================
     # Storage Methods
     # =========================================================================
@@ -5,12 +5,14 @@ Provides async WebSocket connection with auto-reconnection support.
 """
 
 import asyncio
-import json
 import logging
+import random
 from typing import Any, Callable
 
 import aiohttp
 
+from browseragentprotocol import _json
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +25,7 @@ class WebSocketTransport:
         *,
         max_reconnect_attempts: int = 5,
         reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
         auto_reconnect: bool = False,
     ):
         """
@@ -32,11 +35,13 @@ class WebSocketTransport:
             url: WebSocket server URL (e.g., "ws://localhost:9222")
             max_reconnect_attempts: Maximum number of reconnection attempts
             reconnect_delay: Initial delay between reconnection attempts (seconds)
+            max_reconnect_delay: Upper bound for the backoff delay (seconds)
             auto_reconnect: Enable automatic reconnection on disconnect
         """
         self.url = url
         self.max_reconnect_attempts = max_reconnect_attempts
         self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
         self.auto_reconnect = auto_reconnect
 
         self._session: aiohttp.ClientSession | None = None
@@ -122,7 +127,15 @@ class WebSocketTransport:
                     break
 
                 self._reconnect_attempts += 1
-                delay = self.reconnect_delay * (2 ** (self._reconnect_attempts - 1))
+                # Capped exponential backoff with full jitter, so clients that
+                # lost the same server don't all retry at the same moment
+                delay = random.uniform(
+                    0,
+                    min(
+                        self.reconnect_delay * (2 ** (self._reconnect_attempts - 1)),
+                        self.max_reconnect_delay,
+                    ),
+                )
 
                 if self.on_reconnecting:
                     self.on_reconnecting(
@@ -166,7 +179,7 @@ class WebSocketTransport:
         Args:
             data: Dictionary to send as JSON
         """
-        await self.send(json.dumps(data))
+        await self.send(_json.dumps(data))
 
     async def close(self) -> None:
         """Close the WebSocket connection."""
@@ -4,128 +4,253 @@ BAP Protocol Types
 Pydantic models matching the TypeScript protocol definitions.
 """
 
-from browseragentprotocol.types.protocol import (
-    BAP_VERSION,
-    ErrorCodes,
-    JSONRPCError,
-    JSONRPCErrorData,
-    JSONRPCErrorResponse,
-    JSONRPCMessage,
-    JSONRPCNotification,
-    JSONRPCRequest,
-    JSONRPCResponse,
-    JSONRPCSuccessResponse,
-    RequestId,
-)
-from browseragentprotocol.types.selectors import (
-    AriaRole,
-    BAPSelector,
-    CoordinatesSelector,
-    CSSSelector,
-    LabelSelector,
-    PlaceholderSelector,
-    RefSelector,
-    RoleSelector,
-    SemanticSelector,
-    TestIdSelector,
-    TextSelector,
-    XPathSelector,
-)
-from browseragentprotocol.types.common import (
-    AccessibilityNode,
-    ActionOptions,
-    BoundingBox,
-    CheckedState,
-    ClickOptions,
-    ContentFormat,
-    Cookie,
-    HttpMethod,
-    KeyModifier,
-    MouseButton,
-    OriginStorage,
-    Page,
-    PageStatus,
-    ResourceType,
-    SameSiteAttribute,
-    ScreenshotFormat,
-    ScreenshotOptions,
-    ScreenshotScale,
-    ScrollAmount,
-    ScrollDirection,
-    ScrollOptions,
-    StorageState,
-    TypeOptions,
-    Viewport,
-    WaitUntilState,
-)
-from browseragentprotocol.types.agent import (
-    ActionHint,
-    AgentActParams,
-    AgentActResult,
-    AgentExtractParams,
-    AgentExtractResult,
-    AgentObserveParams,
-    AgentObserveResult,
-    AnnotationBadgeStyle,
-    AnnotationBoxStyle,
-    AnnotationLabelFormat,
-    AnnotationMapping,
-    AnnotationOptions,
-    AnnotationStyle,
-    ALLOWED_ACT_ACTIONS,
-    ElementBounds,
-    ElementIdentity,
-    ExecutionStep,
-    ExtractionMode,
-    ExtractionSchema,
-    ExtractionSourceRef,
-    InteractiveElement,
-    ObserveMetadata,
-    ObserveScreenshot,
-    RefStability,
-    StepCondition,
-    StepConditionState,
-    StepError,
-    StepErrorHandling,
-    StepResult,
-)
-from browseragentprotocol.types.methods import (
-    ApprovalRequiredParams,
-    ApprovalRespondParams,
-    ApprovalRespondResult,
-    BrowserLaunchParams,
-    BrowserLaunchResult,
-    ContextCreateParams,
-    ContextCreateResult,
-    ContextDestroyResult,
-    ContextListResult,
-    FrameInfo,
-    FrameListResult,
-    FrameMainResult,
-    FrameSwitchParams,
-    FrameSwitchResult,
-    InitializeParams,
-    InitializeResult,
-    ObserveAccessibilityResult,
-    ObserveAriaSnapshotResult,
-    ObserveContentResult,
-    ObserveDOMResult,
-    ObserveElementResult,
-    ObservePDFResult,
-    ObserveScreenshotResult,
-    PageCreateParams,
-    PageNavigateResult,
-    StreamCancelResult,
-    StreamChunkParams,
-    StreamEndParams,
-)
-from browseragentprotocol.types.events import (
-    ConsoleEvent,
-    DialogEvent,
-    DownloadEvent,
-    NetworkEvent,
-    PageEvent,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from browseragentprotocol.types.protocol import (
+        BAP_VERSION,
+        ErrorCodes,
+        JSONRPCError,
+        JSONRPCErrorData,
+        JSONRPCErrorResponse,
+        JSONRPCMessage,
+        JSONRPCNotification,
+        JSONRPCRequest,
+        JSONRPCResponse,
+        JSONRPCSuccessResponse,
+        RequestId,
+    )
+    from browseragentprotocol.types.selectors import (
+        AriaRole,
+        BAPSelector,
+        CoordinatesSelector,
+        CSSSelector,
+        LabelSelector,
+        PlaceholderSelector,
+        RefSelector,
+        RoleSelector,
+        SemanticSelector,
+        TestIdSelector,
+        TextSelector,
+        XPathSelector,
+    )
+    from browseragentprotocol.types.common import (
+        AccessibilityNode,
+        ActionOptions,
+        BoundingBox,
+        CheckedState,
+        ClickOptions,
+        ContentFormat,
+        Cookie,
+        HttpMethod,
+        KeyModifier,
+        MouseButton,
+        OriginStorage,
+        Page,
+        PageStatus,
+        ResourceType,
+        SameSiteAttribute,
+        ScreenshotFormat,
+        ScreenshotOptions,
+        ScreenshotScale,
+        ScrollAmount,
+        ScrollDirection,
+        ScrollOptions,
+        StorageState,
+        TypeOptions,
+        Viewport,
+        WaitUntilState,
+    )
+    from browseragentprotocol.types.agent import (
+        ActionHint,
+        AgentActParams,
+        AgentActResult,
+        AgentExtractParams,
+        AgentExtractResult,
+        AgentObserveParams,
+        AgentObserveResult,
+        AnnotationBadgeStyle,
+        AnnotationBoxStyle,
+        AnnotationLabelFormat,
+        AnnotationMapping,
+        AnnotationOptions,
+        AnnotationStyle,
+        ALLOWED_ACT_ACTIONS,
+        ElementBounds,
+        ElementIdentity,
+        ExecutionStep,
+        ExtractionMode,
+        ExtractionSchema,
+        ExtractionSourceRef,
+        InteractiveElement,
+        ObserveMetadata,
+        ObserveScreenshot,
+        RefStability,
+        StepCondition,
+        StepConditionState,
+        StepError,
+        StepErrorHandling,
+        StepResult,
+    )
+    from browseragentprotocol.types.methods import (
+        ApprovalRequiredParams,
+        ApprovalRespondParams,
+        ApprovalRespondResult,
+        BrowserLaunchParams,
+        BrowserLaunchResult,
+        ContextCreateParams,
+        ContextCreateResult,
+        ContextDestroyResult,
+        ContextListResult,
+        FrameInfo,
+        FrameListResult,
+        FrameMainResult,
+        FrameSwitchParams,
+        FrameSwitchResult,
+        InitializeParams,
+        InitializeResult,
+        ObserveAccessibilityResult,
+        ObserveAriaSnapshotResult,
+        ObserveContentResult,
+        ObserveDOMResult,
+        ObserveElementResult,
+        ObservePDFResult,
+        ObserveScreenshotResult,
+        PageCreateParams,
+        PageNavigateResult,
+        StreamCancelResult,
+        StreamChunkParams,
+        StreamEndParams,
+    )
+    from browseragentprotocol.types.events import (
+        ConsoleEvent,
+        DialogEvent,
+        DownloadEvent,
+        NetworkEvent,
+        PageEvent,
+    )
+
+# Submodules are imported on first access (PEP 562), so importing one of them
+# (as errors.py does with types.protocol) does not load all the others.
+_LAZY_IMPORTS: dict[str, str] = {
+    # Protocol
+    "BAP_VERSION": "browseragentprotocol.types.protocol",
+    "ErrorCodes": "browseragentprotocol.types.protocol",
+    "JSONRPCError": "browseragentprotocol.types.protocol",
+    "JSONRPCErrorData": "browseragentprotocol.types.protocol",
+    "JSONRPCErrorResponse": "browseragentprotocol.types.protocol",
+    "JSONRPCMessage": "browseragentprotocol.types.protocol",
+    "JSONRPCNotification": "browseragentprotocol.types.protocol",
+    "JSONRPCRequest": "browseragentprotocol.types.protocol",
+    "JSONRPCResponse": "browseragentprotocol.types.protocol",
+    "JSONRPCSuccessResponse": "browseragentprotocol.types.protocol",
+    "RequestId": "browseragentprotocol.types.protocol",
+    # Selectors
+    "AriaRole": "browseragentprotocol.types.selectors",
+    "BAPSelector": "browseragentprotocol.types.selectors",
+    "CoordinatesSelector": "browseragentprotocol.types.selectors",
+    "CSSSelector": "browseragentprotocol.types.selectors",
+    "LabelSelector": "browseragentprotocol.types.selectors",
+    "PlaceholderSelector": "browseragentprotocol.types.selectors",
+    "RefSelector": "browseragentprotocol.types.selectors",
+    "RoleSelector": "browseragentprotocol.types.selectors",
+    "SemanticSelector": "browseragentprotocol.types.selectors",
+    "TestIdSelector": "browseragentprotocol.types.selectors",
+    "TextSelector": "browseragentprotocol.types.selectors",
+    "XPathSelector": "browseragentprotocol.types.selectors",
+    # Common
+    "AccessibilityNode": "browseragentprotocol.types.common",
+    "ActionOptions": "browseragentprotocol.types.common",
+    "BoundingBox": "browseragentprotocol.types.common",
+    "CheckedState": "browseragentprotocol.types.common",
+    "ClickOptions": "browseragentprotocol.types.common",
+    "ContentFormat": "browseragentprotocol.types.common",
+    "Cookie": "browseragentprotocol.types.common",
+    "HttpMethod": "browseragentprotocol.types.common",
+    "KeyModifier": "browseragentprotocol.types.common",
+    "MouseButton": "browseragentprotocol.types.common",
+    "OriginStorage": "browseragentprotocol.types.common",
+    "Page": "browseragentprotocol.types.common",
+    "PageStatus": "browseragentprotocol.types.common",
+    "ResourceType": "browseragentprotocol.types.common",
+    "SameSiteAttribute": "browseragentprotocol.types.common",
+    "ScreenshotFormat": "browseragentprotocol.types.common",
+    "ScreenshotOptions": "browseragentprotocol.types.common",
+    "ScreenshotScale": "browseragentprotocol.types.common",
+    "ScrollAmount": "browseragentprotocol.types.common",
+    "ScrollDirection": "browseragentprotocol.types.common",
+    "ScrollOptions": "browseragentprotocol.types.common",
+    "StorageState": "browseragentprotocol.types.common",
+    "TypeOptions": "browseragentprotocol.types.common",
+    "Viewport": "browseragentprotocol.types.common",
+    "WaitUntilState": "browseragentprotocol.types.common",
+    # Agent
+    "ActionHint": "browseragentprotocol.types.agent",
+    "AgentActParams": "browseragentprotocol.types.agent",
+    "AgentActResult": "browseragentprotocol.types.agent",
+    "AgentExtractParams": "browseragentprotocol.types.agent",
+    "AgentExtractResult": "browseragentprotocol.types.agent",
+    "AgentObserveParams": "browseragentprotocol.types.agent",
+    "AgentObserveResult": "browseragentprotocol.types.agent",
+    "AnnotationBadgeStyle": "browseragentprotocol.types.agent",
+    "AnnotationBoxStyle": "browseragentprotocol.types.agent",
+    "AnnotationLabelFormat": "browseragentprotocol.types.agent",
+    "AnnotationMapping": "browseragentprotocol.types.agent",
+    "AnnotationOptions": "browseragentprotocol.types.agent",
+    "AnnotationStyle": "browseragentprotocol.types.agent",
+    "ALLOWED_ACT_ACTIONS": "browseragentprotocol.types.agent",
+    "ElementBounds": "browseragentprotocol.types.agent",
+    "ElementIdentity": "browseragentprotocol.types.agent",
+    "ExecutionStep": "browseragentprotocol.types.agent",
+    "ExtractionMode": "browseragentprotocol.types.agent",
+    "ExtractionSchema": "browseragentprotocol.types.agent",
+    "ExtractionSourceRef": "browseragentprotocol.types.agent",
+    "InteractiveElement": "browseragentprotocol.types.agent",
+    "ObserveMetadata": "browseragentprotocol.types.agent",
+    "ObserveScreenshot": "browseragentprotocol.types.agent",
+    "RefStability": "browseragentprotocol.types.agent",
+    "StepCondition": "browseragentprotocol.types.agent",
+    "StepConditionState": "browseragentprotocol.types.agent",
+    "StepError": "browseragentprotocol.types.agent",
+    "StepErrorHandling": "browseragentprotocol.types.agent",
+    "StepResult": "browseragentprotocol.types.agent",
+    # Methods
+    "ApprovalRequiredParams": "browseragentprotocol.types.methods",
+    "ApprovalRespondParams": "browseragentprotocol.types.methods",
+    "ApprovalRespondResult": "browseragentprotocol.types.methods",
+    "BrowserLaunchParams": "browseragentprotocol.types.methods",
+    "BrowserLaunchResult": "browseragentprotocol.types.methods",
+    "ContextCreateParams": "browseragentprotocol.types.methods",
+    "ContextCreateResult": "browseragentprotocol.types.methods",
+    "ContextDestroyResult": "browseragentprotocol.types.methods",
+    "ContextListResult": "browseragentprotocol.types.methods",
+    "FrameInfo": "browseragentprotocol.types.methods",
+    "FrameListResult": "browseragentprotocol.types.methods",
+    "FrameMainResult": "browseragentprotocol.types.methods",
+    "FrameSwitchParams": "browseragentprotocol.types.methods",
+    "FrameSwitchResult": "browseragentprotocol.types.methods",
+    "InitializeParams": "browseragentprotocol.types.methods",
+    "InitializeResult": "browseragentprotocol.types.methods",
+    "ObserveAccessibilityResult": "browseragentprotocol.types.methods",
+    "ObserveAriaSnapshotResult": "browseragentprotocol.types.methods",
+    "ObserveContentResult": "browseragentprotocol.types.methods",
+    "ObserveDOMResult": "browseragentprotocol.types.methods",
+    "ObserveElementResult": "browseragentprotocol.types.methods",
+    "ObservePDFResult": "browseragentprotocol.types.methods",
+    "ObserveScreenshotResult": "browseragentprotocol.types.methods",
+    "PageCreateParams": "browseragentprotocol.types.methods",
+    "PageNavigateResult": "browseragentprotocol.types.methods",
+    "StreamCancelResult": "browseragentprotocol.types.methods",
+    "StreamChunkParams": "browseragentprotocol.types.methods",
+    "StreamEndParams": "browseragentprotocol.types.methods",
+    # Events
+    "ConsoleEvent": "browseragentprotocol.types.events",
+    "DialogEvent": "browseragentprotocol.types.events",
+    "DownloadEvent": "browseragentprotocol.types.events",
+    "NetworkEvent": "browseragentprotocol.types.events",
+    "PageEvent": "browseragentprotocol.types.events",
+}
 
 __all__ = [
     # Protocol
@@ -245,3 +370,21 @@ __all__ = [
     "NetworkEvent",
     "PageEvent",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public symbols on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name)
+    # Bind every export of the module at once so later lookups skip __getattr__.
+    namespace = globals()
+    for export, source in _LAZY_IMPORTS.items():
+        if source == module_name:
+            namespace[export] = getattr(module, export)
+    return namespace[name]
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,16 @@
+"""
+Shared Pydantic base model for BAP types.
+"""
+
+from pydantic import BaseModel
+
+
+class BAPBaseModel(BaseModel):
+    """
+    Base class for BAP protocol models.
+
+    Schema building is deferred until a model is first used, so importing
+    the SDK does not compile validators for every protocol type up front.
+    """
+
+    model_config = {"defer_build": True}
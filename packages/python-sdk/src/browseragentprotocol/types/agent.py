@@ -7,8 +7,9 @@ Matches the TypeScript definitions in @browseragentprotocol/protocol.
 from enum import Enum
 from typing import Annotated, Any, Literal, Union
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from browseragentprotocol.types._base import BAPBaseModel
 from browseragentprotocol.types.selectors import BAPSelector
 from browseragentprotocol.types.common import AccessibilityNode, ScreenshotFormat
 
@@ -27,7 +28,7 @@ class StepConditionState(str, Enum):
     DISABLED = "disabled"
 
 
-class StepCondition(BaseModel):
+class StepCondition(BAPBaseModel):
     """Pre-condition for a step (must be true before step executes)."""
 
     selector: Any  # BAPSelector causes issues with forward refs
@@ -43,7 +44,7 @@ class StepErrorHandling(str, Enum):
     RETRY = "retry"
 
 
-class ExecutionStep(BaseModel):
+class ExecutionStep(BAPBaseModel):
     """A single step in an action sequence."""
 
     label: str | None = None
@@ -57,7 +58,7 @@ class ExecutionStep(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class AgentActParams(BaseModel):
+class AgentActParams(BAPBaseModel):
     """Parameters for agent/act."""
 
     page_id: str | None = Field(default=None, alias="pageId")
@@ -69,7 +70,7 @@ class AgentActParams(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class StepError(BaseModel):
+class StepError(BAPBaseModel):
     """Error information for a failed step."""
 
     code: int
@@ -77,7 +78,7 @@ class StepError(BaseModel):
     data: dict[str, Any] | None = None
 
 
-class StepResult(BaseModel):
+class StepResult(BAPBaseModel):
     """Result of a single step execution."""
 
     step: int
@@ -89,7 +90,7 @@ class StepResult(BaseModel):
     retries: int | None = None
 
 
-class AgentActResult(BaseModel):
+class AgentActResult(BAPBaseModel):
     """Result of agent/act."""
 
     completed: int
@@ -120,7 +121,7 @@ class ActionHint(str, Enum):
     SUBMITTABLE = "submittable"
 
 
-class ElementBounds(BaseModel):
+class ElementBounds(BAPBaseModel):
     """Bounding box for an element."""
 
     x: float
@@ -129,7 +130,7 @@ class ElementBounds(BaseModel):
     height: float
 
 
-class ElementIdentity(BaseModel):
+class ElementIdentity(BAPBaseModel):
     """Element identity information for stable reference generation."""
 
     test_id: str | None = Field(default=None, alias="testId")
@@ -152,7 +153,7 @@ class RefStability(str, Enum):
     MOVED = "moved"
 
 
-class InteractiveElement(BaseModel):
+class InteractiveElement(BAPBaseModel):
     """Interactive element with pre-computed selector."""
 
     ref: str
@@ -176,7 +177,7 @@ class InteractiveElement(BaseModel):
 # =============================================================================
 
 
-class AnnotationBadgeStyle(BaseModel):
+class AnnotationBadgeStyle(BAPBaseModel):
     """Badge style for annotation markers."""
 
     color: str | None = None
@@ -187,7 +188,7 @@ class AnnotationBadgeStyle(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class AnnotationBoxStyle(BaseModel):
+class AnnotationBoxStyle(BAPBaseModel):
     """Bounding box style for annotation."""
 
     color: str | None = None
@@ -195,7 +196,7 @@ class AnnotationBoxStyle(BaseModel):
     style: Literal["solid", "dashed"] | None = None
 
 
-class AnnotationStyle(BaseModel):
+class AnnotationStyle(BAPBaseModel):
     """Annotation style options."""
 
     badge: AnnotationBadgeStyle | None = None
@@ -214,7 +215,7 @@ class AnnotationLabelFormat(str, Enum):
     BOTH = "both"
 
 
-class AnnotationOptions(BaseModel):
+class AnnotationOptions(BAPBaseModel):
     """Full annotation options."""
 
     enabled: bool
@@ -226,7 +227,7 @@ class AnnotationOptions(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class AnnotationMapping(BaseModel):
+class AnnotationMapping(BAPBaseModel):
     """Mapping from annotation label to element."""
 
     label: str
@@ -234,7 +235,7 @@ class AnnotationMapping(BaseModel):
     position: dict[str, float]
 
 
-class AgentObserveParams(BaseModel):
+class AgentObserveParams(BAPBaseModel):
     """Parameters for agent/observe."""
 
     page_id: str | None = Field(default=None, alias="pageId")
@@ -257,7 +258,7 @@ class AgentObserveParams(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ObserveMetadata(BaseModel):
+class ObserveMetadata(BAPBaseModel):
     """Page metadata in observation."""
 
     url: str
@@ -265,7 +266,7 @@ class ObserveMetadata(BaseModel):
     viewport: dict[str, int]
 
 
-class ObserveScreenshot(BaseModel):
+class ObserveScreenshot(BAPBaseModel):
     """Screenshot data in observation."""
 
     data: str
@@ -275,7 +276,7 @@ class ObserveScreenshot(BaseModel):
     annotated: bool | None = None
 
 
-class AgentObserveResult(BaseModel):
+class AgentObserveResult(BAPBaseModel):
     """Result of agent/observe."""
 
     metadata: ObserveMetadata | None = None
@@ -322,7 +323,7 @@ ALLOWED_ACT_ACTIONS = [
 # =============================================================================
 
 
-class ExtractionSchema(BaseModel):
+class ExtractionSchema(BAPBaseModel):
     """JSON Schema for extraction (simplified subset)."""
 
     type: Literal["object", "array", "string", "number", "boolean"]
@@ -340,7 +341,7 @@ class ExtractionMode(str, Enum):
     TABLE = "table"
 
 
-class AgentExtractParams(BaseModel):
+class AgentExtractParams(BAPBaseModel):
     """Parameters for agent/extract."""
 
     page_id: str | None = Field(default=None, alias="pageId")
@@ -354,7 +355,7 @@ class AgentExtractParams(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ExtractionSourceRef(BaseModel):
+class ExtractionSourceRef(BAPBaseModel):
     """Source reference for extracted data."""
 
     ref: str
@@ -362,7 +363,7 @@ class ExtractionSourceRef(BaseModel):
     text: str | None = None
 
 
-class AgentExtractResult(BaseModel):
+class AgentExtractResult(BAPBaseModel):
     """Result of agent/extract."""
 
     success: bool
@@ -7,8 +7,9 @@ Matches the TypeScript definitions in @browseragentprotocol/protocol.
 from enum import Enum
 from typing import Any, Literal, Union
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from browseragentprotocol.types._base import BAPBaseModel
 from browseragentprotocol.types.selectors import BAPSelector
 
 # =============================================================================
@@ -16,7 +17,7 @@ from browseragentprotocol.types.selectors import BAPSelector
 # =============================================================================
 
 
-class BoundingBox(BaseModel):
+class BoundingBox(BAPBaseModel):
     """Rectangle representing element position and size."""
 
     x: float
@@ -47,7 +48,7 @@ class MouseButton(str, Enum):
     MIDDLE = "middle"
 
 
-class ActionOptions(BaseModel):
+class ActionOptions(BAPBaseModel):
     """Base options for all actions."""
 
     timeout: int | None = None
@@ -115,7 +116,7 @@ class ScreenshotScale(str, Enum):
     DEVICE = "device"
 
 
-class ScreenshotOptions(BaseModel):
+class ScreenshotOptions(BAPBaseModel):
     """Options for screenshot capture."""
 
     full_page: bool | None = Field(default=None, alias="fullPage")
@@ -150,14 +151,14 @@ class WaitUntilState(str, Enum):
     COMMIT = "commit"
 
 
-class Viewport(BaseModel):
+class Viewport(BAPBaseModel):
     """Viewport dimensions."""
 
     width: int
     height: int
 
 
-class Page(BaseModel):
+class Page(BAPBaseModel):
     """Represents a browser page (tab)."""
 
     id: str
@@ -180,7 +181,7 @@ class SameSiteAttribute(str, Enum):
     NONE = "None"
 
 
-class Cookie(BaseModel):
+class Cookie(BAPBaseModel):
     """Browser cookie."""
 
     name: str
@@ -195,14 +196,14 @@ class Cookie(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class StorageItem(BaseModel):
+class StorageItem(BAPBaseModel):
     """Storage item (key-value pair)."""
 
     name: str
     value: str
 
 
-class OriginStorage(BaseModel):
+class OriginStorage(BAPBaseModel):
     """Origin-specific storage data."""
 
     origin: str
@@ -212,7 +213,7 @@ class OriginStorage(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class StorageState(BaseModel):
+class StorageState(BAPBaseModel):
     """Complete browser storage state (for auth persistence)."""
 
     cookies: list[Cookie]
@@ -223,10 +224,12 @@ class StorageState(BaseModel):
 # Accessibility Types
 # =============================================================================
 
-CheckedState = Union[bool, Literal["mixed"]]
+# Spelled as one Literal rather than Union[bool, Literal["mixed"]] so the
+# validator is a single value lookup instead of a two-arm union.
+CheckedState = Literal[True, False, "mixed"]
 
 
-class AccessibilityNode(BaseModel):
+class AccessibilityNode(BAPBaseModel):
     """Node in the accessibility tree."""
 
     role: str
@@ -7,8 +7,9 @@ Matches the TypeScript definitions in @browseragentprotocol/protocol.
 from enum import Enum
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from browseragentprotocol.types._base import BAPBaseModel
 from browseragentprotocol.types.common import HttpMethod, ResourceType
 
 
@@ -27,7 +28,7 @@ class PageEventType(str, Enum):
     CLOSE = "close"
 
 
-class PageEvent(BaseModel):
+class PageEvent(BAPBaseModel):
     """Page lifecycle event."""
 
     type: Literal["page"]
@@ -55,7 +56,7 @@ class ConsoleLevel(str, Enum):
     ERROR = "error"
 
 
-class ConsoleEvent(BaseModel):
+class ConsoleEvent(BAPBaseModel):
     """Console message event."""
 
     type: Literal["console"]
@@ -83,7 +84,7 @@ class NetworkEventType(str, Enum):
     FAILED = "failed"
 
 
-class NetworkRequestInfo(BaseModel):
+class NetworkRequestInfo(BAPBaseModel):
     """Network request information."""
 
     request_id: str = Field(alias="requestId")
@@ -96,7 +97,7 @@ class NetworkRequestInfo(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class NetworkResponseInfo(BaseModel):
+class NetworkResponseInfo(BAPBaseModel):
     """Network response information."""
 
     request_id: str = Field(alias="requestId")
@@ -108,7 +109,7 @@ class NetworkResponseInfo(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class NetworkFailedInfo(BaseModel):
+class NetworkFailedInfo(BAPBaseModel):
     """Network failure information."""
 
     request_id: str = Field(alias="requestId")
@@ -118,7 +119,7 @@ class NetworkFailedInfo(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class NetworkEvent(BaseModel):
+class NetworkEvent(BAPBaseModel):
     """Network activity event."""
 
     type: Literal["network"]
@@ -146,7 +147,7 @@ class DialogType(str, Enum):
     BEFOREUNLOAD = "beforeunload"
 
 
-class DialogEvent(BaseModel):
+class DialogEvent(BAPBaseModel):
     """Dialog opened event."""
 
     type: Literal["dialog"]
@@ -174,7 +175,7 @@ class DownloadState(str, Enum):
     FAILED = "failed"
 
 
-class DownloadEvent(BaseModel):
+class DownloadEvent(BAPBaseModel):
     """Download progress event."""
 
     type: Literal["download"]
@@ -6,8 +6,9 @@ Matches the TypeScript definitions in @browseragentprotocol/protocol.
 
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from browseragentprotocol.types._base import BAPBaseModel
 from browseragentprotocol.types.common import (
     AccessibilityNode,
     BoundingBox,
@@ -22,14 +23,14 @@ from browseragentprotocol.types.selectors import BAPSelector
 # =============================================================================
 
 
-class ClientInfo(BaseModel):
+class ClientInfo(BAPBaseModel):
     """Client identification."""
 
     name: str
     version: str
 
 
-class ClientCapabilities(BaseModel):
+class ClientCapabilities(BAPBaseModel):
     """Client capabilities."""
 
     events: list[str] | None = None
@@ -37,7 +38,7 @@ class ClientCapabilities(BaseModel):
     compression: bool | None = None
 
 
-class InitializeParams(BaseModel):
+class InitializeParams(BAPBaseModel):
     """Parameters for initialize."""
 
     protocol_version: str = Field(alias="protocolVersion")
@@ -47,14 +48,14 @@ class InitializeParams(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ServerInfo(BaseModel):
+class ServerInfo(BAPBaseModel):
     """Server identification."""
 
     name: str
     version: str
 
 
-class ServerCapabilities(BaseModel):
+class ServerCapabilities(BAPBaseModel):
     """Server capabilities."""
 
     browsers: list[str] | None = None
@@ -65,7 +66,7 @@ class ServerCapabilities(BaseModel):
     compression: bool | None = None
 
 
-class InitializeResult(BaseModel):
+class InitializeResult(BAPBaseModel):
     """Result of initialize."""
 
     protocol_version: str = Field(alias="protocolVersion")
@@ -80,7 +81,7 @@ class InitializeResult(BaseModel):
 # =============================================================================
 
 
-class BrowserLaunchParams(BaseModel):
+class BrowserLaunchParams(BAPBaseModel):
     """Parameters for browser/launch."""
 
     browser: Literal["chromium", "firefox", "webkit"] | None = None
@@ -96,7 +97,7 @@ class BrowserLaunchParams(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class BrowserLaunchResult(BaseModel):
+class BrowserLaunchResult(BAPBaseModel):
     """Result of browser/launch."""
 
     browser_id: str = Field(alias="browserId")
@@ -111,7 +112,7 @@ class BrowserLaunchResult(BaseModel):
 # =============================================================================
 
 
-class PageCreateParams(BaseModel):
+class PageCreateParams(BAPBaseModel):
     """Parameters for page/create."""
 
     url: str | None = None
@@ -120,7 +121,7 @@ class PageCreateParams(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class PageNavigateResult(BaseModel):
+class PageNavigateResult(BAPBaseModel):
     """Result of page/navigate."""
 
     url: str
@@ -132,7 +133,7 @@ class PageNavigateResult(BaseModel):
 # =============================================================================
 
 
-class ContextOptions(BaseModel):
+class ContextOptions(BAPBaseModel):
     """Options for creating a browser context."""
 
     viewport: Viewport | None = None
@@ -149,7 +150,7 @@ class ContextOptions(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ContextCreateParams(BaseModel):
+class ContextCreateParams(BAPBaseModel):
     """Parameters for context/create."""
 
     context_id: str | None = Field(default=None, alias="contextId")
@@ -158,7 +159,7 @@ class ContextCreateParams(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ContextCreateResult(BaseModel):
+class ContextCreateResult(BAPBaseModel):
     """Result of context/create."""
 
     context_id: str = Field(alias="contextId")
@@ -166,7 +167,7 @@ class ContextCreateResult(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ContextInfo(BaseModel):
+class ContextInfo(BAPBaseModel):
     """Information about a browser context."""
 
     id: str
@@ -177,14 +178,14 @@ class ContextInfo(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ContextListResult(BaseModel):
+class ContextListResult(BAPBaseModel):
     """Result of context/list."""
 
     contexts: list[ContextInfo]
     limits: dict[str, int]
 
 
-class ContextDestroyResult(BaseModel):
+class ContextDestroyResult(BAPBaseModel):
     """Result of context/destroy."""
 
     pages_destroyed: int = Field(alias="pagesDestroyed")
@@ -197,7 +198,7 @@ class ContextDestroyResult(BaseModel):
 # =============================================================================
 
 
-class FrameInfo(BaseModel):
+class FrameInfo(BAPBaseModel):
     """Information about a frame."""
 
     frame_id: str = Field(alias="frameId")
@@ -209,13 +210,13 @@ class FrameInfo(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class FrameListResult(BaseModel):
+class FrameListResult(BAPBaseModel):
     """Result of frame/list."""
 
     frames: list[FrameInfo]
 
 
-class FrameSwitchParams(BaseModel):
+class FrameSwitchParams(BAPBaseModel):
     """Parameters for frame/switch."""
 
     page_id: str | None = Field(default=None, alias="pageId")
@@ -226,7 +227,7 @@ class FrameSwitchParams(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class FrameSwitchResult(BaseModel):
+class FrameSwitchResult(BAPBaseModel):
     """Result of frame/switch."""
 
     frame_id: str = Field(alias="frameId")
@@ -235,7 +236,7 @@ class FrameSwitchResult(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class FrameMainResult(BaseModel):
+class FrameMainResult(BAPBaseModel):
     """Result of frame/main."""
 
     frame_id: str = Field(alias="frameId")
@@ -248,7 +249,7 @@ class FrameMainResult(BaseModel):
 # =============================================================================
 
 
-class ObserveScreenshotResult(BaseModel):
+class ObserveScreenshotResult(BAPBaseModel):
     """Result of observe/screenshot."""
 
     data: str
@@ -257,13 +258,13 @@ class ObserveScreenshotResult(BaseModel):
     height: int
 
 
-class ObserveAccessibilityResult(BaseModel):
+class ObserveAccessibilityResult(BAPBaseModel):
     """Result of observe/accessibility."""
 
     tree: list[AccessibilityNode]
 
 
-class ObserveDOMResult(BaseModel):
+class ObserveDOMResult(BAPBaseModel):
     """Result of observe/dom."""
 
     html: str
@@ -272,27 +273,27 @@ class ObserveDOMResult(BaseModel):
     url: str
 
 
-class ObserveElementResult(BaseModel):
+class ObserveElementResult(BAPBaseModel):
     """Result of observe/element."""
 
     properties: dict[str, Any]
 
 
-class ObservePDFResult(BaseModel):
+class ObservePDFResult(BAPBaseModel):
     """Result of observe/pdf."""
 
     data: str
     pages: int
 
 
-class ObserveContentResult(BaseModel):
+class ObserveContentResult(BAPBaseModel):
     """Result of observe/content."""
 
     content: str
     format: str
 
 
-class ObserveAriaSnapshotResult(BaseModel):
+class ObserveAriaSnapshotResult(BAPBaseModel):
     """Result of observe/ariaSnapshot."""
 
     snapshot: str
@@ -305,7 +306,7 @@ class ObserveAriaSnapshotResult(BaseModel):
 # =============================================================================
 
 
-class StreamChunkParams(BaseModel):
+class StreamChunkParams(BAPBaseModel):
     """Parameters for stream/chunk notification."""
 
     stream_id: str = Field(alias="streamId")
@@ -317,7 +318,7 @@ class StreamChunkParams(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class StreamEndParams(BaseModel):
+class StreamEndParams(BAPBaseModel):
     """Parameters for stream/end notification."""
 
     stream_id: str = Field(alias="streamId")
@@ -328,7 +329,7 @@ class StreamEndParams(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class StreamCancelResult(BaseModel):
+class StreamCancelResult(BAPBaseModel):
     """Result of stream/cancel."""
 
     cancelled: bool
@@ -339,7 +340,7 @@ class StreamCancelResult(BaseModel):
 # =============================================================================
 
 
-class ApprovalElementInfo(BaseModel):
+class ApprovalElementInfo(BAPBaseModel):
     """Information about an element for approval."""
 
     role: str
@@ -347,7 +348,7 @@ class ApprovalElementInfo(BaseModel):
     bounds: BoundingBox
 
 
-class ApprovalContext(BaseModel):
+class ApprovalContext(BAPBaseModel):
     """Context for an approval request."""
 
     page_url: str = Field(alias="pageUrl")
@@ -358,7 +359,7 @@ class ApprovalContext(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ApprovalRequiredParams(BaseModel):
+class ApprovalRequiredParams(BAPBaseModel):
     """Parameters for approval/required notification."""
 
     request_id: str = Field(alias="requestId")
@@ -370,7 +371,7 @@ class ApprovalRequiredParams(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ApprovalRespondParams(BaseModel):
+class ApprovalRespondParams(BAPBaseModel):
     """Parameters for approval/respond."""
 
     request_id: str = Field(alias="requestId")
@@ -380,7 +381,7 @@ class ApprovalRespondParams(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class ApprovalRespondResult(BaseModel):
+class ApprovalRespondResult(BAPBaseModel):
     """Result of approval/respond."""
 
     acknowledged: bool
@@ -4,9 +4,13 @@ JSON-RPC 2.0 protocol types with Pydantic models.
 Matches the TypeScript definitions in @browseragentprotocol/protocol.
 """
 
-from typing import Any, Literal, Union
+from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from typing import Annotated, Any, Literal
+
+from pydantic import Discriminator, Field, Tag
+
+from browseragentprotocol.types._base import BAPBaseModel
 
 # =============================================================================
 # Protocol Version
@@ -18,7 +22,7 @@ BAP_VERSION = "0.2.0"
 # Request ID
 # =============================================================================
 
-RequestId = Union[str, int]
+RequestId = str | int
 
 # =============================================================================
 # Error Codes
@@ -77,7 +81,7 @@ class ErrorCodes:
 # =============================================================================
 
 
-class JSONRPCErrorData(BaseModel):
+class JSONRPCErrorData(BAPBaseModel):
     """Optional data attached to JSON-RPC errors."""
 
     retryable: bool = False
@@ -87,7 +91,7 @@ class JSONRPCErrorData(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class JSONRPCError(BaseModel):
+class JSONRPCError(BAPBaseModel):
     """JSON-RPC error object."""
 
     code: int
@@ -95,7 +99,7 @@ class JSONRPCError(BaseModel):
     data: JSONRPCErrorData | None = None
 
 
-class JSONRPCRequest(BaseModel):
+class JSONRPCRequest(BAPBaseModel):
     """JSON-RPC request message."""
 
     jsonrpc: Literal["2.0"] = "2.0"
@@ -104,7 +108,7 @@ class JSONRPCRequest(BaseModel):
     params: dict[str, Any] | None = None
 
 
-class JSONRPCSuccessResponse(BaseModel):
+class JSONRPCSuccessResponse(BAPBaseModel):
     """JSON-RPC success response."""
 
     jsonrpc: Literal["2.0"] = "2.0"
@@ -112,7 +116,7 @@ class JSONRPCSuccessResponse(BaseModel):
     result: Any
 
 
-class JSONRPCErrorResponse(BaseModel):
+class JSONRPCErrorResponse(BAPBaseModel):
     """JSON-RPC error response."""
 
     jsonrpc: Literal["2.0"] = "2.0"
@@ -120,7 +124,7 @@ class JSONRPCErrorResponse(BaseModel):
     error: JSONRPCError
 
 
-class JSONRPCNotification(BaseModel):
+class JSONRPCNotification(BAPBaseModel):
     """JSON-RPC notification (no id, no response expected)."""
 
     jsonrpc: Literal["2.0"] = "2.0"
@@ -128,10 +132,30 @@ class JSONRPCNotification(BaseModel):
     params: dict[str, Any] | None = None
 
 
+def _message_kind(message: Any) -> str | None:
+    """Pick the JSONRPCMessage variant from the keys a message carries."""
+    if isinstance(message, dict):
+        if "method" in message:
+            return "request" if "id" in message else "notification"
+        return "error" if "error" in message else "success"
+    return _MESSAGE_KINDS.get(type(message))
+
+
+_MESSAGE_KINDS: dict[type, str] = {
+    JSONRPCRequest: "request",
+    JSONRPCSuccessResponse: "success",
+    JSONRPCErrorResponse: "error",
+    JSONRPCNotification: "notification",
+}
+
 # Union types
-JSONRPCResponse = Union[JSONRPCSuccessResponse, JSONRPCErrorResponse]
-JSONRPCMessage = Union[
-    JSONRPCRequest, JSONRPCSuccessResponse, JSONRPCErrorResponse, JSONRPCNotification
+JSONRPCResponse = JSONRPCSuccessResponse | JSONRPCErrorResponse
+JSONRPCMessage = Annotated[
+    Annotated[JSONRPCRequest, Tag("request")]
+    | Annotated[JSONRPCSuccessResponse, Tag("success")]
+    | Annotated[JSONRPCErrorResponse, Tag("error")]
+    | Annotated[JSONRPCNotification, Tag("notification")],
+    Discriminator(_message_kind),
 ]
 
 
@@ -157,9 +181,6 @@ def is_notification(message: dict[str, Any]) -> bool:
 
 def is_error_response(response: dict[str, Any]) -> bool:
     """Check if a response is an error."""
-    if "error" not in response:
-        return False
-
     error = response.get("error")
     if not isinstance(error, dict):
         return False
@@ -4,11 +4,15 @@ BAP selector types with Pydantic models.
 Matches the TypeScript definitions in @browseragentprotocol/protocol.
 """
 
+from collections.abc import Callable
 from enum import Enum
-from typing import Annotated, Literal, Union
+from functools import lru_cache
+from typing import Annotated, Literal, ParamSpec, TypeVar, Union, cast
 
 from pydantic import BaseModel, Field
 
+from browseragentprotocol.types._base import BAPBaseModel
+
 # =============================================================================
 # ARIA Roles
 # =============================================================================
@@ -93,21 +97,27 @@ class AriaRole(str, Enum):
 # =============================================================================
 
 
-class CSSSelector(BaseModel):
+class _SelectorModel(BAPBaseModel):
+    """Base for selector models: immutable (and therefore hashable) values."""
+
+    model_config = {"frozen": True}
+
+
+class CSSSelector(_SelectorModel):
     """CSS selector."""
 
     type: Literal["css"] = "css"
     value: str
 
 
-class XPathSelector(BaseModel):
+class XPathSelector(_SelectorModel):
     """XPath selector."""
 
     type: Literal["xpath"] = "xpath"
     value: str
 
 
-class RoleSelector(BaseModel):
+class RoleSelector(_SelectorModel):
     """Role-based selector (ARIA)."""
 
     type: Literal["role"] = "role"
@@ -116,7 +126,7 @@ class RoleSelector(BaseModel):
     exact: bool | None = None
 
 
-class TextSelector(BaseModel):
+class TextSelector(_SelectorModel):
     """Text content selector."""
 
     type: Literal["text"] = "text"
@@ -124,7 +134,7 @@ class TextSelector(BaseModel):
     exact: bool | None = None
 
 
-class LabelSelector(BaseModel):
+class LabelSelector(_SelectorModel):
     """Label selector (for form elements)."""
 
     type: Literal["label"] = "label"
@@ -132,7 +142,7 @@ class LabelSelector(BaseModel):
     exact: bool | None = None
 
 
-class PlaceholderSelector(BaseModel):
+class PlaceholderSelector(_SelectorModel):
     """Placeholder selector (for inputs)."""
 
     type: Literal["placeholder"] = "placeholder"
@@ -140,21 +150,21 @@ class PlaceholderSelector(BaseModel):
     exact: bool | None = None
 
 
-class TestIdSelector(BaseModel):
+class TestIdSelector(_SelectorModel):
     """Test ID selector (data-testid attribute)."""
 
     type: Literal["testId"] = "testId"
     value: str
 
 
-class SemanticSelector(BaseModel):
+class SemanticSelector(_SelectorModel):
     """Semantic selector (AI-resolved)."""
 
     type: Literal["semantic"] = "semantic"
     description: str
 
 
-class CoordinatesSelector(BaseModel):
+class CoordinatesSelector(_SelectorModel):
     """Coordinate-based selector."""
 
     type: Literal["coordinates"] = "coordinates"
@@ -162,7 +172,7 @@ class CoordinatesSelector(BaseModel):
     y: float
 
 
-class RefSelector(BaseModel):
+class RefSelector(_SelectorModel):
     """Ref selector - reference a stable element by its ref ID."""
 
     type: Literal["ref"] = "ref"
@@ -191,17 +201,33 @@ BAPSelector = Annotated[
 # Selector Factory Functions
 # =============================================================================
 
+_P = ParamSpec("_P")
+_S = TypeVar("_S", bound=BaseModel)
+
+
+def _interned(factory: Callable[_P, _S]) -> Callable[_P, _S]:
+    """
+    Cache a selector factory so repeated calls return the same instance.
+
+    Safe because selector models are frozen. ``typed=True`` keeps e.g.
+    ``role(AriaRole.BUTTON)`` and ``role("button")`` as distinct entries.
+    """
+    return cast(Callable[_P, _S], lru_cache(maxsize=1024, typed=True)(factory))
+
 
+@_interned
 def css(value: str) -> CSSSelector:
     """Create a CSS selector."""
     return CSSSelector(type="css", value=value)
 
 
+@_interned
 def xpath(value: str) -> XPathSelector:
     """Create an XPath selector."""
     return XPathSelector(type="xpath", value=value)
 
 
+@_interned
 def role(
     role: AriaRole | str,
     name: str | None = None,
@@ -211,21 +237,25 @@ def role(
     return RoleSelector(type="role", role=role, name=name, exact=exact)
 
 
+@_interned
 def text(value: str, exact: bool | None = None) -> TextSelector:
     """Create a text selector."""
     return TextSelector(type="text", value=value, exact=exact)
 
 
+@_interned
 def label(value: str, exact: bool | None = None) -> LabelSelector:
     """Create a label selector."""
     return LabelSelector(type="label", value=value, exact=exact)
 
 
+@_interned
 def placeholder(value: str, exact: bool | None = None) -> PlaceholderSelector:
     """Create a placeholder selector."""
     return PlaceholderSelector(type="placeholder", value=value, exact=exact)
 
 
+@_interned
 def test_id(value: str) -> TestIdSelector:
     """Create a test ID selector."""
     return TestIdSelector(type="testId", value=value)
@@ -235,16 +265,19 @@ def test_id(value: str) -> TestIdSelector:
 test_id.__test__ = False
 
 
+@_interned
 def semantic(description: str) -> SemanticSelector:
     """Create a semantic selector (AI-resolved)."""
     return SemanticSelector(type="semantic", description=description)
 
 
+@_interned
 def coords(x: float, y: float) -> CoordinatesSelector:
     """Create a coordinates selector."""
     return CoordinatesSelector(type="coordinates", x=x, y=y)
 
 
+@_interned
 def ref(ref_id: str) -> RefSelector:
     """Create a ref selector (for stable element refs)."""
     return RefSelector(type="ref", ref=ref_id)
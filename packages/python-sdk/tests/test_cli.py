@@ -5,7 +5,8 @@ import sys
 import pytest
 
 from browseragentprotocol import __version__
-from browseragentprotocol.cli import main
+from browseragentprotocol.cli import _parse_fast, _run_repl_line, main
+from browseragentprotocol.types.methods import InitializeResult
 
 
 def test_version_command_prints_current_package_version(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
@@ -26,3 +27,42 @@ def test_no_args_prints_help(monkeypatch: pytest.MonkeyPatch, capsys: pytest.Cap
 
     assert exc_info.value.code == 0
     assert "Browser Agent Protocol (BAP) Python SDK CLI" in capsys.readouterr().out
+
+
+def test_fast_path_parses_common_invocations() -> None:
+    assert _parse_fast(["info", "ws://localhost:9222", "--json", "--token=abc"]) == {
+        "command": "info",
+        "url": "ws://localhost:9222",
+        "token": "abc",
+        "json_output": True,
+    }
+    assert _parse_fast(["connect", "ws://localhost:9222", "--timeout", "2.5"]) == {
+        "command": "connect",
+        "url": "ws://localhost:9222",
+        "token": None,
+        "timeout": 2.5,
+    }
+    # Help requests and malformed input are left to argparse.
+    assert _parse_fast(["connect", "--help"]) is None
+    assert _parse_fast(["connect", "ws://localhost:9222", "--timeout", "soon"]) is None
+
+
+async def test_repl_reuses_the_open_client(capsys: pytest.CaptureFixture[str]) -> None:
+    class FakeClient:
+        async def list_pages(self) -> dict[str, object]:
+            return {"pages": [], "activePage": None}
+
+    result = InitializeResult.model_validate(
+        {
+            "protocolVersion": "0.2.0",
+            "serverInfo": {"name": "test-server", "version": "1.0.0"},
+            "capabilities": {},
+        }
+    )
+    client = FakeClient()
+
+    assert await _run_repl_line(client, result, "info") is True  # type: ignore[arg-type]
+    assert "test-server" in capsys.readouterr().out
+    assert await _run_repl_line(client, result, "pages") is True  # type: ignore[arg-type]
+    assert '"pages"' in capsys.readouterr().out
+    assert await _run_repl_line(client, result, "quit") is False  # type: ignore[arg-type]
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from browseragentprotocol.client import BAPClient
+from browseragentprotocol.errors import BAPError
+from browseragentprotocol.types.protocol import BAP_VERSION, ErrorCodes
+from browseragentprotocol.types.selectors import css
+
+
+class FakeTransport:
+    """Records outgoing messages and answers every request with its params."""
+
+    def __init__(self, client: BAPClient) -> None:
+        self.client = client
+        self.sent: list[dict[str, Any]] = []
+        self.respond = True
+        self.closed = False
+        self.results: dict[str, Any] = {}
+        self.unanswered: set[str] = set()
+
+    async def connect(self) -> None:
+        pass
+
+    async def send(self, message: str) -> None:
+        request = json.loads(message)
+        self.sent.append(request)
+        if self.respond and "id" in request and request["method"] not in self.unanswered:
+            result = self.results.get(request["method"], request["params"])
+            response = {"jsonrpc": "2.0", "id": request["id"], "result": result}
+            asyncio.get_running_loop().call_soon(self.client._handle_message, json.dumps(response))
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def make_client(**kwargs: Any) -> tuple[BAPClient, FakeTransport]:
+    client = BAPClient("ws://localhost:9222", **kwargs)
+    transport = FakeTransport(client)
+    client._transport = transport  # type: ignore[assignment]
+    return client, transport
+
+
+async def test_concurrent_requests_resolve_to_their_own_responses() -> None:
+    client, transport = make_client()
+
+    results = await asyncio.gather(*(client._request("echo", {"n": n}) for n in range(4)))
+
+    assert results == [{"n": n} for n in range(4)]
+    assert [request["id"] for request in transport.sent] == [1, 2, 3, 4]
+    assert client._pending_requests == {}
+
+
+async def test_requests_time_out_in_order_with_a_shared_timer() -> None:
+    client, transport = make_client(timeout=0.05)
+    transport.respond = False
+
+    first = asyncio.ensure_future(client._request("slow", {}))
+    await asyncio.sleep(0.02)
+    second = asyncio.ensure_future(client._request("slower", {}))
+
+    with pytest.raises(BAPError, match="slow") as first_error:
+        await first
+    assert first_error.value.code == ErrorCodes.Timeout
+    assert not second.done()
+    with pytest.raises(BAPError, match="slower"):
+        await second
+    assert client._pending_requests == {}
+    assert not client._deadlines
+    assert client._timeout_handle is None
+
+
+async def test_cancelled_close_still_fails_pending_requests_and_closes_the_transport() -> None:
+    client, transport = make_client()
+    transport.respond = False
+    client._initialized = True
+
+    pending = asyncio.ensure_future(client._request("slow", {}))
+    closing = asyncio.ensure_future(client.close())
+    await asyncio.sleep(0)
+    closing.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await closing
+    with pytest.raises(BAPError, match="Client closed"):
+        await pending
+    await asyncio.sleep(0)
+    assert transport.closed
+    assert client._pending_requests == {}
+
+
+async def test_screenshot_bytes_returns_decoded_data() -> None:
+    client, transport = make_client()
+    transport.results["observe/screenshot"] = {
+        "data": base64.b64encode(b"\x89PNG").decode(),
+        "format": "png",
+        "width": 1,
+        "height": 1,
+    }
+
+    assert await client.screenshot_bytes() == b"\x89PNG"
+
+
+async def test_connect_does_not_wait_for_the_subscription_ack() -> None:
+    client, transport = make_client()
+    transport.results["initialize"] = {
+        "protocolVersion": BAP_VERSION,
+        "serverInfo": {"name": "test-server", "version": "1.0.0"},
+        "capabilities": {},
+    }
+    transport.unanswered.add("events/subscribe")
+
+    result = await asyncio.wait_for(client.connect(), timeout=1)
+
+    assert result.server_info.name == "test-server"
+    assert [request["method"] for request in transport.sent] == [
+        "initialize",
+        "notifications/initialized",
+        "events/subscribe",
+    ]
+
+
+async def test_subscription_failures_are_logged_but_not_close_errors(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    async def connected_client() -> tuple[BAPClient, FakeTransport]:
+        client, transport = make_client()
+        transport.results["initialize"] = {
+            "protocolVersion": BAP_VERSION,
+            "serverInfo": {"name": "test-server", "version": "1.0.0"},
+            "capabilities": {},
+        }
+        transport.unanswered.add("events/subscribe")
+        await client.connect()
+        return client, transport
+
+    client, _ = await connected_client()
+    await client.close()
+    await asyncio.sleep(0)
+    assert "Event subscription failed" not in caplog.text
+
+    client, transport = await connected_client()
+    error = {"code": ErrorCodes.InvalidParams, "message": "unknown event"}
+    response = {"jsonrpc": "2.0", "id": transport.sent[-1]["id"], "error": error}
+    client._handle_message(json.dumps(response))
+    await asyncio.sleep(0)
+    assert "Event subscription failed: unknown event" in caplog.text
+
+
+async def test_observe_bundle_sends_requests_before_awaiting_results() -> None:
+    client, transport = make_client()
+    transport.unanswered.update({"observe/dom", "observe/ariaSnapshot"})
+
+    bundle = asyncio.ensure_future(client.observe_bundle(screenshot=False))
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert [request["method"] for request in transport.sent] == [
+        "observe/dom",
+        "observe/ariaSnapshot",
+    ]
+
+    results = {
+        1: {"html": "<p></p>", "text": "", "title": "", "url": "about:blank"},
+        2: {"snapshot": "- paragraph", "url": "about:blank", "title": ""},
+    }
+    for request_id, result in results.items():
+        client._handle_message(json.dumps({"jsonrpc": "2.0", "id": request_id, "result": result}))
+
+    assert list(await bundle) == ["dom", "aria"]
+    assert (await bundle)["aria"].snapshot == "- paragraph"
+
+
+def test_handler_unsubscribing_during_dispatch_does_not_skip_others() -> None:
+    client = BAPClient("ws://localhost:9222")
+    seen: list[str] = []
+
+    def once(params: dict[str, Any]) -> None:
+        seen.append("once")
+        unsubscribe_once()
+
+    unsubscribe_once = client.on("console", once)
+    client.on("console", lambda params: seen.append("always"))
+
+    for _ in range(2):
+        client._handle_message(
+            json.dumps({"jsonrpc": "2.0", "method": "event/console", "params": {}})
+        )
+
+    assert seen == ["once", "always", "always"]
+
+
+def test_stream_chunk_handler_unsubscribing_during_dispatch() -> None:
+    client = BAPClient("ws://localhost:9222")
+    seen: list[int] = []
+
+    def once(chunk: Any) -> None:
+        seen.append(chunk.index)
+        unsubscribe_once()
+
+    unsubscribe_once = client.on_stream_chunk(once)
+    client.on_stream_chunk(lambda chunk: seen.append(-chunk.index))
+
+    for index in range(2):
+        params = {"streamId": "s", "index": index, "data": "", "offset": 0, "size": 0}
+        client._handle_message(
+            json.dumps({"jsonrpc": "2.0", "method": "stream/chunk", "params": params})
+        )
+
+    assert seen == [0, 0, -1]
+
+
+def test_raw_stream_chunk_handlers_skip_validation() -> None:
+    client = BAPClient("ws://localhost:9222")
+    received: list[dict[str, Any]] = []
+    client.on_stream_chunk_raw(received.append)
+
+    params = {"streamId": "s", "data": "abc"}
+    client._handle_message(
+        json.dumps({"jsonrpc": "2.0", "method": "stream/chunk", "params": params})
+    )
+
+    assert received == [params]
+
+
+def test_serialize_selector_accepts_frozen_and_duck_typed_models() -> None:
+    class LegacySelector(BaseModel):
+        type: str = "css"
+        value: str
+
+    client = BAPClient("ws://localhost:9222")
+
+    assert client._serialize_selector(css("#submit")) == {"type": "css", "value": "#submit"}
+    assert client._serialize_selector(css("#submit")) is client._serialize_selector(css("#submit"))
+    assert client._serialize_selector(LegacySelector(value="#submit")) == {  # type: ignore[arg-type]
+        "type": "css",
+        "value": "#submit",
+    }
+    raw = {"type": "css", "value": "#submit"}
+    assert client._serialize_selector(raw) is raw
+
+
+def test_token_is_appended_to_the_query_string() -> None:
+    assert BAPClient("ws://localhost:9222", token="abc")._url == "ws://localhost:9222?token=abc"
+    assert (
+        BAPClient("ws://localhost:9222/bap?x=1#top", token="a&b")._url
+        == "ws://localhost:9222/bap?x=1&token=a%26b#top"
+    )
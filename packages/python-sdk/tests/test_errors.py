@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pytest
+
+from browseragentprotocol import errors
+from browseragentprotocol.errors import (
+    BAPConnectionError,
+    BAPElementNotFoundError,
+    BAPError,
+    BAPInvalidParamsError,
+    BAPNavigationError,
+    BAPPageNotFoundError,
+    BAPTimeoutError,
+    create_error_from_code,
+)
+from browseragentprotocol.types.protocol import ErrorCodes
+
+
+@pytest.mark.parametrize(
+    ("code", "details", "expected_type", "expected_message"),
+    [
+        (ErrorCodes.Timeout, {"timeout": 5}, BAPTimeoutError, "boom"),
+        (ErrorCodes.PageNotFound, {"pageId": "p1"}, BAPPageNotFoundError, "Page not found: p1"),
+        (ErrorCodes.PageNotFound, None, BAPPageNotFoundError, "Page not found: unknown"),
+        (ErrorCodes.NavigationFailed, {"url": "https://x"}, BAPNavigationError, "boom"),
+        (ErrorCodes.InvalidParams, {"field": "url"}, BAPInvalidParamsError, "boom"),
+        (12345, {"a": 1}, BAPError, "boom"),
+    ],
+)
+def test_create_error_from_code_picks_the_specialized_class(
+    code: int,
+    details: dict[str, object] | None,
+    expected_type: type[BAPError],
+    expected_message: str,
+) -> None:
+    error = create_error_from_code(code, "boom", details=details)
+
+    assert type(error) is expected_type
+    assert error.code == code
+    assert error.message == expected_message
+
+
+def test_create_error_from_code_keeps_retry_hints_for_element_errors() -> None:
+    error = create_error_from_code(
+        ErrorCodes.ElementNotFound,
+        "gone",
+        retryable=False,
+        retry_after_ms=None,
+        details={"selector": "#a"},
+    )
+
+    assert isinstance(error, BAPElementNotFoundError)
+    assert error.retryable is False
+    assert error.retry_after_ms == 500
+    assert error.details == {"selector": "#a"}
+
+
+def test_invalid_request_and_params_keep_the_server_retry_hints_and_details() -> None:
+    for code in (ErrorCodes.InvalidRequest, ErrorCodes.InvalidParams):
+        error = create_error_from_code(code, "bad", retryable=True, retry_after_ms=250, details={})
+
+        assert error.retryable is True
+        assert error.retry_after_ms == 250
+        assert error.details == {}
+        assert create_error_from_code(code, "bad").details is None
+
+
+def test_every_error_subclass_is_reachable_from_an_error_code() -> None:
+    built = {type(errors.create_error_from_code(code, "boom")) for code in errors._ERROR_BUILDERS}
+    subclasses: set[type[BAPError]] = set()
+    pending = [BAPError]
+    while pending:  # walk the whole hierarchy, not just direct subclasses
+        for subclass in pending.pop().__subclasses__():
+            subclasses.add(subclass)
+            pending.append(subclass)
+    # BAPConnectionError uses the generic ServerError code and is raised locally only
+    subclasses -= {BAPConnectionError}
+
+    assert subclasses <= built
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from browseragentprotocol.types.protocol import (
+    JSONRPCErrorResponse,
+    JSONRPCMessage,
+    JSONRPCNotification,
+    JSONRPCRequest,
+    JSONRPCSuccessResponse,
+)
+
+message_adapter: TypeAdapter[Any] = TypeAdapter(JSONRPCMessage)
+
+
+@pytest.mark.parametrize(
+    ("message", "expected_type"),
+    [
+        ({"jsonrpc": "2.0", "id": 1, "method": "page/reload"}, JSONRPCRequest),
+        ({"jsonrpc": "2.0", "id": 1, "result": None}, JSONRPCSuccessResponse),
+        (
+            {"jsonrpc": "2.0", "id": 1, "error": {"code": -32600, "message": "bad"}},
+            JSONRPCErrorResponse,
+        ),
+        ({"jsonrpc": "2.0", "method": "event/console", "params": {}}, JSONRPCNotification),
+    ],
+)
+def test_jsonrpc_message_dispatches_on_message_keys(
+    message: dict[str, Any], expected_type: type
+) -> None:
+    parsed = message_adapter.validate_python(message)
+
+    assert type(parsed) is expected_type
+    assert message_adapter.validate_python(parsed) is parsed
+
+
+def test_jsonrpc_message_reports_errors_against_the_chosen_variant() -> None:
+    with pytest.raises(ValidationError) as error:
+        message_adapter.validate_python({"jsonrpc": "2.0", "id": 1, "error": {"code": "x"}})
+
+    assert all(item["loc"][0] == "error" for item in error.value.errors())
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import subprocess
+import sys
 from importlib.metadata import version
 
+import pytest
+from pydantic import ValidationError
+
+import browseragentprotocol
 from browseragentprotocol import (
     BAPClient,
     BAPClientSync,
@@ -38,3 +44,72 @@ def test_selector_factories_return_expected_shapes() -> None:
     }
     assert stable_ref.model_dump() == {"type": "ref", "ref": "@e1"}
     assert test_selector.model_dump() == {"type": "testId", "value": "login-submit"}
+
+
+def test_package_import_defers_sdk_modules() -> None:
+    code = (
+        "import sys, browseragentprotocol; "
+        "print('browseragentprotocol.client' in sys.modules, 'pydantic' in sys.modules)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == "False False"
+
+
+def test_client_import_skips_unused_type_modules() -> None:
+    code = (
+        "import sys, browseragentprotocol.client; "
+        "print('browseragentprotocol.types.events' in sys.modules)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == "False"
+
+
+def test_all_matches_the_lazy_import_table() -> None:
+    exports = browseragentprotocol.__all__
+
+    assert len(exports) == len(set(exports))
+    assert set(exports) == {"__version__", *browseragentprotocol._LAZY_IMPORTS}
+
+
+def test_selectors_are_immutable_values() -> None:
+    submit_button = role("button", "Submit")
+
+    assert submit_button == role("button", "Submit")
+    assert hash(submit_button) == hash(role("button", "Submit"))
+    with pytest.raises(ValidationError):
+        submit_button.name = "Cancel"  # type: ignore[misc]
+
+
+def test_selector_factories_intern_repeated_calls() -> None:
+    assert role("button", "Submit") is role("button", "Submit")
+    assert test_id("login-submit") is test_id("login-submit")
+    assert role("button", "Submit") is not role("button", "Cancel")
+
+
+def test_importing_types_does_not_build_model_schemas() -> None:
+    code = (
+        "import importlib, inspect, pydantic\n"
+        "built, models = [], 0\n"
+        "for name in ('common', 'methods', 'agent', 'events', 'selectors', 'protocol'):\n"
+        "    module = importlib.import_module(f'browseragentprotocol.types.{name}')\n"
+        "    for value in vars(module).values():\n"
+        "        if (inspect.isclass(value) and issubclass(value, pydantic.BaseModel)\n"
+        "                and value.__module__ == module.__name__):\n"
+        "            models += 1\n"
+        "            if value.__pydantic_complete__:\n"
+        "                built.append(value.__qualname__)\n"
+        "print(models, sorted(built))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    models, built = output.strip().split(" ", 1)
+
+    assert int(models) > 0
+    assert built == "[]"
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from browseragentprotocol.errors import BAPConnectionError
+from browseragentprotocol.sse import SSETransport
+
+
+def make_transport(handler: httpx.MockTransport) -> SSETransport:
+    transport = SSETransport("http://localhost:9222")
+    transport._client = httpx.AsyncClient(base_url=transport.base_url, transport=handler)
+    return transport
+
+
+async def test_send_raises_connection_error_with_the_http_status() -> None:
+    transport = make_transport(httpx.MockTransport(lambda request: httpx.Response(503)))
+
+    with pytest.raises(BAPConnectionError, match="HTTP error: 503") as error:
+        await transport.send("{}")
+    assert error.value.details == {"status": 503}
+
+
+async def test_send_wraps_transport_failures() -> None:
+    def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    transport = make_transport(httpx.MockTransport(refuse))
+
+    with pytest.raises(BAPConnectionError, match="refused") as error:
+        await transport.send(b"{}")
+    assert isinstance(error.value.__cause__, httpx.ConnectError)
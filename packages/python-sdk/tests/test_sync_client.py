@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from typing import Any
+
+from browseragentprotocol.client import BAPClient
+from browseragentprotocol.sync_client import BAPClientSync
+
+
+class EchoTransport:
+    """Answers every request with its params and records the answering thread."""
+
+    def __init__(self, client: BAPClient) -> None:
+        self.client = client
+        self.threads: set[str] = set()
+        self.closed = False
+
+    async def connect(self) -> None:
+        pass
+
+    async def send(self, message: str) -> None:
+        request = json.loads(message)
+        self.threads.add(threading.current_thread().name)
+        response = {"jsonrpc": "2.0", "id": request["id"], "result": request["params"]}
+        asyncio.get_running_loop().call_soon(self.client._handle_message, json.dumps(response))
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def make_sync_client() -> tuple[BAPClientSync, EchoTransport]:
+    client = BAPClientSync("ws://localhost:9222")
+    transport = EchoTransport(client._async_client)
+    client._async_client._transport = transport  # type: ignore[assignment]
+    return client, transport
+
+
+def test_calls_run_on_the_loop_thread_from_any_caller() -> None:
+    client, transport = make_sync_client()
+    results: list[Any] = []
+
+    results.append(client._run(client._async_client._request("echo", {"n": 1})))
+    worker = threading.Thread(
+        target=lambda: results.append(client._run(client._async_client._request("echo", {"n": 2})))
+    )
+    worker.start()
+    worker.join()
+
+    assert results == [{"n": 1}, {"n": 2}]
+    assert transport.threads == {"bap-client-sync"}
+    client._stop_loop()
+
+
+async def test_sync_client_works_inside_a_running_event_loop() -> None:
+    client, transport = make_sync_client()
+    client._async_client._initialized = True
+
+    assert client._run(client._async_client._request("echo", {"ok": True})) == {"ok": True}
+
+    client.close()
+    assert transport.closed
+    assert client._loop is None
+
+
+def test_sync_calls_from_a_client_callback_raise_instead_of_deadlocking() -> None:
+    client, transport = make_sync_client()
+    errors: list[BaseException] = []
+    done = threading.Event()
+
+    def handler(params: dict[str, Any]) -> None:
+        for call in (lambda: client._run(client._async_client._request("echo", {})), client.close):
+            try:
+                call()
+            except RuntimeError as error:
+                errors.append(error)
+        done.set()
+
+    client._async_client.on("console", handler)
+    message = json.dumps({"jsonrpc": "2.0", "method": "event/console", "params": {}})
+    client._get_loop().call_soon_threadsafe(client._async_client._handle_message, message)
+
+    assert done.wait(timeout=5)
+    assert [str(error) for error in errors] == [
+        "BAPClientSync methods cannot be called from client callbacks"
+    ] * 2
+    assert client._run(client._async_client._request("echo", {"ok": True})) == {"ok": True}
+    client.close()
+    assert transport.closed
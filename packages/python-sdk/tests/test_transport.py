@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pytest
+
+from browseragentprotocol import transport as transport_module
+from browseragentprotocol.transport import WebSocketTransport
+
+
+async def test_reconnect_backoff_is_jittered_and_capped(monkeypatch: pytest.MonkeyPatch) -> None:
+    delays: list[float] = []
+
+    async def record_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    async def refuse() -> None:
+        raise ConnectionError("refused")
+
+    transport = WebSocketTransport(
+        "ws://localhost:9222",
+        max_reconnect_attempts=6,
+        reconnect_delay=1.0,
+        max_reconnect_delay=4.0,
+    )
+    monkeypatch.setattr(transport, "connect", refuse)
+    monkeypatch.setattr(transport_module.asyncio, "sleep", record_sleep)
+    monkeypatch.setattr(transport_module.random, "uniform", lambda low, high: high)
+
+    with pytest.raises(Exception, match="after 6 attempts"):
+        await transport._attempt_reconnect()
+
+    assert delays == [1.0, 2.0, 4.0, 4.0, 4.0, 4.0]
@@ -168,10 +168,10 @@ for (const pkg of npmPackages) {
 const pythonPackageJsonVersion = getPackageVersion("packages/python-sdk/package.json");
 const canonicalReleaseVersion = getPackageVersion("packages/cli/package.json");
 const pyprojectToml = readText("packages/python-sdk/pyproject.toml");
-const pythonInit = readText("packages/python-sdk/src/browseragentprotocol/__init__.py");
+const pythonVersionModule = readText("packages/python-sdk/src/browseragentprotocol/_version.py");
 
 const pyprojectVersion = pyprojectToml.match(/^version = "([^"]+)"$/m)?.[1];
-const initVersion = pythonInit.match(/^__version__ = "([^"]+)"$/m)?.[1];
+const initVersion = pythonVersionModule.match(/^__version__ = "([^"]+)"$/m)?.[1];
 
 console.log("\nChecking browser-agent-protocol (PyPI)");
 assert(existsSync(resolve(repoRoot, "packages/python-sdk/LICENSE")), "Python SDK includes a LICENSE file");
@@ -9,9 +9,9 @@ const repoRoot = resolve(dirname(fileURLToPath(import.meta.url)), "..");
 const canonicalPackageJsonPath = resolve(repoRoot, "packages/cli/package.json");
 const pythonPackageJsonPath = resolve(repoRoot, "packages/python-sdk/package.json");
 const pyprojectPath = resolve(repoRoot, "packages/python-sdk/pyproject.toml");
-const pythonInitPath = resolve(
+const pythonVersionPath = resolve(
   repoRoot,
-  "packages/python-sdk/src/browseragentprotocol/__init__.py",
+  "packages/python-sdk/src/browseragentprotocol/_version.py",
 );
 
 const canonicalVersion = JSON.parse(readFileSync(canonicalPackageJsonPath, "utf8")).version;
@@ -41,7 +41,7 @@ updatedSomething =
   ) || updatedSomething;
 
 updatedSomething =
-  updateFile(pythonInitPath, (content) =>
+  updateFile(pythonVersionPath, (content) =>
     content.replace(/^__version__ = "([^"]+)"$/m, `__version__ = "${canonicalVersion}"`),
   ) || updatedSomething;
 